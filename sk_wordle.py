@@ -8,19 +8,150 @@ Purpose: To experiment with different Wordle solvers in python. The secondary go
 """
 
 #imports
+import os
+import atexit
+import tempfile
+import time
+import tracemalloc
+import functools
+import hashlib
 import random
+import multiprocessing
+import asyncio
+import socket
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import OrderedDict
+from collections.abc import Sequence
+import csv
+import json
 import numpy as np
-from matplotlib import pyplot as plt
-from statistics import mean
-import pandas as pd
-import seaborn as sns
+from statistics import mean, stdev, NormalDist
+#matplotlib, pandas and seaborn only get imported when they're actually needed (see load_pyplot etc. below), so that the solvers can run headless without paying for them
+
+#Folder where compile_words saves compiled dictionaries (and their feedback matrices). Left as None, the text files are always read directly; set it to a folder (e.g. sk_wordle.CACHE_DIR = "/home/skannan4/.cache/sk_wordle") and every load_words call, including all the "DEFAULT" ones, goes through the cache
+CACHE_DIR = None
+
+#Roughly how many bytes the big feedback computations are allowed to use. Work on guessword x keyword pairs gets done in blocks sized to a small slice of this (see block_size), and any feedback matrix bigger than this gets built in a disk-backed array (in CACHE_DIR if it's set, or the temp folder) instead of in memory
+MEMORY_BUDGET = 1 << 30
+
+#####Opt-in instrumentation#####
+#For working out where a slow sim or benchmark actually spends its time. A profile is a python dict of timers and call counts for each phase (loading, building engines, each guesser, feedback and trimming), plus the size of the candidate set after each turn for each mode. Nothing gets measured unless a profile is switched on with use_profile (the sims and benchmarks do this for you if you hand them one). Only functions that get called once or so per turn are wrapped (never compare_words, which runs once per word), so normal runs just pay for an extra function call and a None check on those.
+
+#The profile currently being filled in, if any
+_profile = None
+
+#make_profile: Makes an empty profile.
+    #parameters: none
+    #returns: the profile
+def make_profile():
+    return {"timers": dict(), "calls": dict(), "games": dict(), "turns": dict(), "cells": list(), "mode": None, "turn": 0}
+
+#use_profile: Switches to filling in a different profile (or None to stop measuring).
+    #parameters: profile
+    #returns: the profile that was being filled in before, so it can be put back
+def use_profile(profile):
+    global _profile
+    previous = _profile
+    _profile = profile
+    return previous
+
+#profiled: Decorator that times a function under the given phase name whenever a profile is switched on. With sizes = True, the length of whatever the function returns also gets recorded as the candidate set size for the current turn (this is how trim_dict reports in).
+def profiled(name, sizes = False):
+    def wrap(function):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            if _profile is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            profile_time(name, time.perf_counter() - start)
+            if sizes:
+                _profile["turn"] += 1
+                profile_size(len(result))
+            return result
+        return timed
+    return wrap
+
+#profile_time: Adds one call of a phase to the current profile.
+    #parameters: name - phase name; seconds
+    #returns: none
+def profile_time(name, seconds):
+    _profile["timers"][name] = _profile["timers"].get(name, 0) + seconds
+    _profile["calls"][name] = _profile["calls"].get(name, 0) + 1
+
+#profile_size: Records how many candidates are left at the current turn of the current game, as [games, total, smallest, largest] for each turn (turns nothing got recorded for, e.g. when a game is played without going through play_game_method, stay at [0, 0, None, None]). The current mode can also be a list of modes - a sacrifice sweep plays several thresholds in one game, and the size gets recorded for each threshold that's still in the branch being played.
+    #parameters: size
+    #returns: none
+def profile_size(size):
+    for mode in _profile["mode"] if isinstance(_profile["mode"], list) else [_profile["mode"]]:
+        turns = _profile["turns"].setdefault(mode, list())
+        while len(turns) <= _profile["turn"]:
+            turns.append([0, 0, None, None])
+        entry = turns[_profile["turn"]]
+        entry[2] = size if entry[0] == 0 else min(entry[2], size)
+        entry[3] = size if entry[0] == 0 else max(entry[3], size)
+        entry[0] += 1
+        entry[1] += size
+
+#merge_profile: Adds one profile's numbers into another (e.g. from each parallel worker back into the main one).
+    #parameters: profile - the one to add to; other - the one to add
+    #returns: profile
+def merge_profile(profile, other):
+    for name in other["timers"]:
+        profile["timers"][name] = profile["timers"].get(name, 0) + other["timers"][name]
+        profile["calls"][name] = profile["calls"].get(name, 0) + other["calls"][name]
+    for mode in other["games"]:
+        profile["games"][mode] = profile["games"].get(mode, 0) + other["games"][mode]
+    for mode in other["turns"]:
+        turns = profile["turns"].setdefault(mode, list())
+        for turn, entry in enumerate(other["turns"][mode]):
+            if turn >= len(turns):
+                turns.append(list(entry))
+            elif turns[turn][0] == 0:
+                turns[turn] = list(entry)
+            elif entry[0] > 0:
+                turns[turn] = [turns[turn][0] + entry[0], turns[turn][1] + entry[1], min(turns[turn][2], entry[2]), max(turns[turn][3], entry[3])]
+    profile["cells"].extend(other["cells"])
+    return profile
+
+#print_profile: Prints out a profile - time spent in each phase (slowest first), then the average candidate set size after each turn for each mode.
+    #parameters: profile
+    #returns: none
+def print_profile(profile):
+    for name in sorted(profile["timers"], key = lambda name: -profile["timers"][name]):
+        print("%-20s %10d calls %10.3f s %12.1f us/call" % (name, profile["calls"][name], profile["timers"][name], 1e6 * profile["timers"][name] / profile["calls"][name]))
+    for mode in profile["turns"]:
+        print(mode, "(%d games) average candidates by turn:" % profile["games"].get(mode, 0), " ".join("%.1f" % (entry[1] / entry[0]) if entry[0] > 0 else "-" for entry in profile["turns"][mode]))
+
+#save_profile: Dumps a profile to a JSON file, e.g. next to a run's per-game records.
+    #parameters: profile; path
+    #returns: none
+def save_profile(profile, path):
+    with open(path, "w") as f:
+        json.dump({key: profile[key] for key in ["timers", "calls", "games", "turns", "cells"]}, f, indent = 1)
+
+#add_profile_cell: Adds the profile of one piece of a bigger run (e.g. one dictionary or word length of a multi-benchmark) into the profile for the whole run, and also keeps its timers separately in profile["cells"], labelled with the dictionary and its size, so you can see how each phase scales.
+    #parameters: profile; cell_profile; library - dictionary name (or None); word_length; size - number of words in the dictionary
+    #returns: none
+def add_profile_cell(profile, cell_profile, library, word_length, size):
+    merge_profile(profile, cell_profile)
+    profile["cells"].append({"library": library, "word_length": word_length, "words": size, "timers": cell_profile["timers"], "calls": cell_profile["calls"]})
 
 #####Basic functions that are used in every part of this project#####
 
 #load_words: Takes a newline-delineated file and imports it into python as a list to serve as a dictionary (whether for selecting a keyword or for aiding a solver)
-    #parameters: filename, word_length; doprint - whether to print updates
+    #parameters: filename, word_length; doprint - whether to print updates; cache_dir - folder of compiled dictionaries to load from (see compile_words). Defaults to CACHE_DIR, and False always reads the text file
     #returns: the loaded dictionary
-def load_words(filename, word_length, doprint = True):
+@profiled("load")
+def load_words(filename, word_length, doprint = True, cache_dir = None):
+    if cache_dir is None:
+        cache_dir = CACHE_DIR
+    if cache_dir:
+        paths = compile_words(filename, word_length, cache_dir, doprint = doprint)
+        if paths is not None:
+            dictionary = unpack_words(np.load(paths[0], mmap_mode = "r"))
+            if doprint: print(len(dictionary), "words loaded from compiled dictionary.")
+            return dictionary
     dictionary = list()
     if doprint: print("Loading words from dictionary...")
     with open(filename) as f:
@@ -31,9 +162,14 @@ def load_words(filename, word_length, doprint = True):
     return dictionary
 
 #compare_words: My approach for word matching as done in wordle. The output of this is of form [0-2, 0-2, 0-2, 0-2, 0-2], where 0 means no match (grey in wordle), 1 means letter in the wrong spot (yellow in wordle), and 2 means exact match (green in wordle). The tricky part is how to handle all those multi-letter words. I used a goofy system to mark when a letter was a match in the keyword, so that a repeat letter in the guessword wouldn't trigger a match.
-    #parameters: keyword - this is the correct answer; guessword - this is the guess; word_length
+    #parameters: keyword - this is the correct answer; guessword - this is the guess; word_length; engine - optional output of build_engine, used to look the comparison up instead of recomputing it
     #returns: the comparison between keyword and guessword in the form [0-2, 0-2, 0-2, 0-2, 0-2]
-def compare_words(keyword, guessword, word_length):
+def compare_words(keyword, guessword, word_length, engine = None):
+    if engine is not None and engine["matrix"] is not None: #If there's a precomputed feedback matrix and both words are in it, just look the answer up
+        keyword_index = engine["index"].get(keyword)
+        guessword_index = engine["index"].get(guessword)
+        if keyword_index is not None and guessword_index is not None:
+            return decode_compare(engine["matrix"][guessword_index, keyword_index], word_length)
     compare = [0] * word_length
     keyword = list(keyword)
     guessword = list(guessword)
@@ -47,30 +183,394 @@ def compare_words(keyword, guessword, word_length):
     return compare
 
 #trim_dict: So I admit in advance that I used the word "dictionary" to refer to multiple entities, which is probably quite annoying (made worse by the fact that these dictionaries aren't python's dictionary structure). Here, in this function, the dictionary refers to the source of guesswords for the computer. After a given guess, the only words that should remain in the dictionary are words that would produce the same output as the keyword when compared against the guessword. This function trims the dictionary to only those words and returns the trimmed list.
-    #parameters: dictionary - this is the current source of guesswords; guessword - this is the most recent guess that produced some comparison output; compare - this is the actual comparison output (the output of compare_words), word_length
+    #parameters: dictionary - this is the current source of guesswords (either a list or a CandidateSet); guessword - this is the most recent guess that produced some comparison output; compare - this is the actual comparison output (the output of compare_words), word_length; engine - optional output of build_engine, used to look up comparisons instead of calling compare_words for every word
     #returns: the dictionary after it has been trimmed based on the current guess
-def trim_dict(dictionary, guessword, compare, word_length):
-    for word in list(dictionary):
-        if compare_words(word, guessword, word_length) != compare:
-            dictionary.remove(word)
+@profiled("trim", sizes = True)
+def trim_dict(dictionary, guessword, compare, word_length, engine = None):
+    if isinstance(dictionary, CandidateSet): #candidate sets get filtered in one go, with no compare_words calls at all
+        if dictionary.engine["constraints"] is not None and len(dictionary) >= len(dictionary.engine["words"]) // 16: #the constraint bitsets cover the whole dictionary, so they only pay off while there are still lots of candidates
+            dictionary.indices = constraint_filter(dictionary, guessword, compare)
+        else:
+            dictionary.indices = dictionary.indices[candidate_codes(dictionary, guessword) == encode_compare(compare)]
+        return dictionary
+    if engine is not None and engine["matrix"] is not None and guessword in engine["index"]:
+        try:
+            indices = np.fromiter((engine["index"][word] for word in dictionary), dtype = np.intp, count = len(dictionary))
+        except KeyError: #some word isn't in the engine, so fall back to doing it the slow way
+            indices = None
+        if indices is not None:
+            keep = engine["matrix"][engine["index"][guessword], indices] == encode_compare(compare) #one row of the matrix holds every possible comparison for this guessword
+            dictionary[:] = [word for word, k in zip(dictionary, keep) if k]
+            return dictionary
+    dictionary[:] = [word for word in dictionary if compare_words(word, guessword, word_length) == compare] #one pass, rather than removing the words one at a time
     return dictionary
 
 #count_chars: This function is used in the half and max guessers. It calculates the frequency of each letter within words of a dictionary (normalized to the number of words) - thus, in a sense, it tells you what percentage of words remaining in the dictionary have a given letter (albeit not exactly because of repeat letters; I didn't really care to adjust for this for these simple purposes).
     #parameters: dictionary (which here likely refers to the source of guesswords)
     #returns: a dict (e.g. the python data structure, lol) with frequencies of occurrence for each letter
 def count_chars(dictionary):
+    if isinstance(dictionary, CandidateSet): #with an engine, this is just a sum over the precomputed letter counts
+        return dict(zip("abcdefghijklmnopqrstuvwxyz", letter_frequencies(dictionary).tolist()))
     count = dict.fromkeys(['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z'], 0)
     for char in "".join(dictionary):
         count[char] += 1/len(dictionary)
     return count
 
+#####Precomputed feedback engine#####
+#Note - everything in this section is optional. All of the functions above and below work fine on plain lists of words, but every turn of every game calls compare_words once per remaining word, which adds up quickly in the sims and benchmarks. An "engine" is just a python dict holding precomputed stuff for one dictionary at one word length (most importantly, the compare_words output for every guessword/keyword pair), so that the comparisons only ever get done once.
+
+#block_size: Rough number of guessword x keyword pairs to work on at once. Each pair needs a few tens of bytes of temporary arrays along the way, so this keeps a block to about an eighth of MEMORY_BUDGET (4 million pairs for the default 1 GB).
+    #parameters: none
+    #returns: the number of pairs
+def block_size():
+    return max(1 << 12, MEMORY_BUDGET // 256)
+
+#encode_compare: Packs the output of compare_words into a single base-3 integer, with position i worth 3**i. So [0, 0, 0, 0, 0] is 0 and the solved state [2, 2, 2, 2, 2] is 3**word_length - 1.
+    #parameters: compare - a comparison in the form [0-2, 0-2, 0-2, 0-2, 0-2]
+    #returns: the comparison as an integer
+def encode_compare(compare):
+    code = 0
+    for value in reversed(compare):
+        code = code * 3 + value
+    return code
+
+#decode_compare: Undoes encode_compare.
+    #parameters: code - an integer from encode_compare (or from a feedback matrix); word_length
+    #returns: the comparison in the form [0-2, 0-2, 0-2, 0-2, 0-2]
+def decode_compare(code, word_length):
+    code = int(code)
+    compare = [0] * word_length
+    for i in range(0, word_length):
+        compare[i] = code % 3
+        code //= 3
+    return compare
+
+#feedback_dtype: Smallest unsigned numpy type that can hold every encoded comparison for a given word length (uint8 covers up to 5 letters, uint16 up to 10).
+    #parameters: word_length
+    #returns: a numpy dtype
+def feedback_dtype(word_length):
+    if 3**word_length <= 2**8:
+        return np.uint8
+    if 3**word_length <= 2**16:
+        return np.uint16
+    if 3**word_length <= 2**32:
+        return np.uint32
+    return np.uint64
+
+#word_codes: Turns a list of words into a numpy array of letters, one row per word, with a = 0 through z = 25. Like count_chars, this assumes the words are all lowercase a-z.
+    #parameters: dictionary; word_length
+    #returns: a uint8 array of shape (number of words, word_length)
+def word_codes(dictionary, word_length):
+    if len(dictionary) == 0:
+        return np.zeros((0, word_length), dtype = np.uint8)
+    return (np.frombuffer("".join(dictionary).encode("ascii"), dtype = np.uint8) - ord("a")).reshape(len(dictionary), word_length)
+
+#feedback_codes: The vectorized version of compare_words. It calculates the encoded comparison for every guessword against every keyword, keeping the exact same rules as compare_words - a letter is a 2 if it matches in place, and a 1 if it's anywhere among the keyword's non-matched letters (so a repeated letter in the guessword can get a 1 more than once). Work is done in blocks of guesswords so the temporary arrays stay small.
+    #parameters: guesses - guesswords as an array from word_codes; answers - keywords as an array from word_codes; word_length; output - optional array of zeros to fill in instead of making a new one (e.g. a disk-backed one, see feedback_matrix)
+    #returns: an array of shape (number of guesswords, number of keywords) of encoded comparisons (see encode_compare)
+def feedback_codes(guesses, answers, word_length, output = None):
+    if output is None:
+        output = np.zeros((len(guesses), len(answers)), dtype = feedback_dtype(word_length))
+    if len(guesses) == 0 or len(answers) == 0:
+        return output
+    mask = np.uint8 if word_length <= 8 else (np.uint16 if word_length <= 16 else np.uint32) #the smallest type that fits a bit per position, since these arrays are what all the time goes into
+    positions = np.zeros((26, len(answers)), dtype = mask) #positions[letter, keyword] is a bitmask of where that letter shows up in the keyword
+    for i in range(0, word_length):
+        positions[answers[:, i], np.arange(len(answers))] |= mask(1 << i)
+    block = max(1, block_size() // len(answers))
+    for start in range(0, len(guesses), block):
+        guess_block = guesses[start:start + block]
+        greens = np.zeros((len(guess_block), len(answers)), dtype = mask) #bitmask of exact matches, same as the keyword[i] = 0 trick in compare_words
+        for i in range(0, word_length):
+            greens |= (guess_block[:, i, None] == answers[None, :, i]).astype(mask) << mask(i)
+        not_greens = ~greens
+        output_block = output[start:start + block]
+        for i in range(0, word_length):
+            green = (greens >> mask(i)) & mask(1)
+            yellow = (positions[guess_block[:, i]] & not_greens) != 0
+            yellow &= green == 0
+            output_block += ((green << mask(1)) | yellow).astype(output.dtype) * output.dtype.type(3**i)
+    return output
+
+#feedback_matrix: Builds the full feedback matrix (every word against every word) for word codes. If it fits in MEMORY_BUDGET it's just an array, otherwise (or if a path is given) it gets filled in block by block straight into a disk-backed .npy file and handed back memory-mapped, so only the block being worked on ever has to be in memory. Files made up here without a path get cleaned up when python exits.
+    #parameters: codes - array from word_codes; word_length; path - optional .npy file to build it in; doprint - whether to print updates
+    #returns: the matrix (possibly an np.memmap)
+def feedback_matrix(codes, word_length, path = None, doprint = True):
+    dtype = feedback_dtype(word_length)
+    size = len(codes) * len(codes) * np.dtype(dtype).itemsize
+    if path is None and size <= MEMORY_BUDGET:
+        return feedback_codes(codes, codes, word_length)
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix = ".feedback.npy", dir = CACHE_DIR or None)
+        os.close(handle)
+        atexit.register(lambda: os.path.exists(path) and os.remove(path))
+    if doprint: print("Building %.1f GB feedback matrix on disk at %s..." % (size / 1e9, path))
+    matrix = np.lib.format.open_memmap(path, mode = "w+", dtype = dtype, shape = (len(codes), len(codes))) #starts out as all zeros, which is what feedback_codes expects
+    feedback_codes(codes, codes, word_length, matrix)
+    matrix.flush()
+    del matrix
+    return np.load(path, mmap_mode = "r")
+
+#build_engine: Precomputes everything needed to play games on a dictionary faster. The engine is a python dict with the word list, a lookup from word to its position in that list, the letters as an array, the positions of all words (shared by every CandidateSet that covers the whole dictionary), a word x letter table of letter counts, and (optionally) the feedback matrix, where matrix[i, j] is the encoded comparison of guessword i against keyword j. The matrix is (number of words)^2 bytes, so ~170 MB for the Wordle accepted list - hence the option to skip it (and if it's bigger than MEMORY_BUDGET, it lives on disk, see feedback_matrix).
+    #parameters: dictionary; word_length; feedback - whether to build the feedback matrix; doprint - whether to print updates; constraints - whether to build the constraint index (see build_constraint_index), which trim_dict then uses instead of working out the comparisons
+    #returns: the engine
+@profiled("build_engine")
+def build_engine(dictionary, word_length, feedback = True, doprint = True, constraints = False):
+    words = list(dictionary)
+    index = dict()
+    for i, word in enumerate(words):
+        index.setdefault(word, i) #if there are duplicates, keep the first one
+    engine = {"word_length": word_length, "words": words, "index": index, "codes": word_codes(words, word_length), "all": np.arange(len(words)), "matrix": None}
+    engine["all"].flags.writeable = False
+    engine["letter_counts"] = np.zeros((len(words), 26), dtype = np.uint8) #letter_counts[word, letter] is how many times the letter shows up in the word
+    for i in range(0, word_length):
+        engine["letter_counts"][engine["all"], engine["codes"][:, i]] += 1
+    engine["letter_presence"] = (engine["letter_counts"] > 0).astype(np.uint8) #and letter_presence is just whether it shows up at all
+    engine["letter_masks"] = engine["letter_presence"].astype(np.uint32) @ (np.uint32(1) << np.arange(26, dtype = np.uint32)) #the same thing packed into one number per word, bit 0 for a through bit 25 for z
+    engine["letter_order"] = None #the whole dictionary's letters from most to least common, worked out the first time guess_sacrifice needs it
+    engine["openers"] = dict() #opening guesses for guess_entropy and guess_minimax, which are the expensive ones to work out
+    engine["fingerprint"] = hashlib.blake2b("\n".join(words).encode("utf-8"), digest_size = 16).digest() #identifies the word list, so candidate sets from different engines never get mixed up in a decision cache
+    if feedback:
+        if doprint: print("Building feedback matrix for", len(words), "words...")
+        engine["matrix"] = feedback_matrix(engine["codes"], word_length, doprint = doprint)
+    engine["constraints"] = build_constraint_index(engine) if constraints else None
+    return engine
+
+#CandidateSet: A list-like view of some of the words in an engine. Rather than every game making its own copy of the dictionary and whittling it down with list.remove, a candidate set just holds an array of positions into the engine's (shared, never changing) word list, and trim_dict replaces that array with a filtered one. It can be used anywhere a list of words can be read from (len, indexing, looping, random.choice etc.).
+class CandidateSet(Sequence):
+    def __init__(self, engine, indices):
+        self.engine = engine
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CandidateSet(self.engine, self.indices[i])
+        return self.engine["words"][self.indices[i]]
+
+    def __iter__(self):
+        words = self.engine["words"]
+        return (words[i] for i in self.indices)
+
+    #copy: The indices are never changed in place (trim_dict swaps in a new array), so copies can share them
+    def copy(self):
+        return CandidateSet(self.engine, self.indices)
+
+#candidate_set: Makes a CandidateSet for a dictionary out of an engine.
+    #parameters: engine - output of build_engine; dictionary - the words to include. Can be left out (or be the engine's own word list) to include every word, or be another CandidateSet
+    #returns: the CandidateSet
+def candidate_set(engine, dictionary = None):
+    if isinstance(dictionary, CandidateSet):
+        return dictionary.copy()
+    if dictionary is None or dictionary is engine["words"] or (isinstance(dictionary, list) and dictionary == engine["words"]):
+        return CandidateSet(engine, engine["all"])
+    return CandidateSet(engine, np.fromiter((engine["index"][word] for word in dictionary), dtype = np.intp, count = len(dictionary)))
+
+#candidate_codes: Gets the encoded comparison (see encode_compare) of a guessword against every word in a candidate set, from the feedback matrix if there is one and otherwise by calculating it with feedback_codes. The guessword doesn't need to be in the engine.
+    #parameters: candidates - a CandidateSet; guessword
+    #returns: array of encoded comparisons, one for each candidate
+@profiled("feedback") #timed here rather than on compare_words, which gets called once per word and can't afford the wrapper
+def candidate_codes(candidates, guessword):
+    engine = candidates.engine
+    if engine["matrix"] is not None and guessword in engine["index"]:
+        return engine["matrix"][engine["index"][guessword], candidates.indices]
+    return feedback_codes(word_codes([guessword], engine["word_length"]), engine["codes"][candidates.indices], engine["word_length"])[0]
+
+#letter_frequencies: The vectorized version of count_chars for a CandidateSet. The letter counts just get summed over the candidates' rows, but the frequencies are built up the same way count_chars does it (adding 1/len over and over, which np.cumsum does one step at a time too) so they come out exactly equal and the guessers break ties exactly the same way.
+    #parameters: candidates - a CandidateSet
+    #returns: array of the 26 letter frequencies, a through z
+def letter_frequencies(candidates):
+    counts = candidates.engine["letter_counts"][candidates.indices].sum(axis = 0, dtype = np.int64)
+    if len(candidates) == 0 or counts.max() == 0:
+        return np.zeros(26)
+    running_total = np.cumsum(np.full(counts.max(), 1/len(candidates)))
+    return np.where(counts > 0, running_total[np.maximum(counts - 1, 0)], 0.0)
+
+#Bits set in each possible byte, for popcount on older numpy versions
+POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(0, 256)], dtype = np.uint8)
+
+#popcount: Counts the bits that are set in each number of an array of letter masks.
+    #parameters: masks - array of uint32
+    #returns: array of counts
+def popcount(masks):
+    if hasattr(np, "bitwise_count"): #numpy 2.0 and up
+        return np.bitwise_count(masks)
+    return POPCOUNT_TABLE[masks.view(np.uint8).reshape(-1, 4)].sum(axis = 1)
+
+#letter_mask: Packs some letters into a letter mask like the ones in engine["letter_masks"].
+    #parameters: letters - letter numbers (a = 0 through z = 25) or the letters themselves
+    #returns: the mask, as a python int
+def letter_mask(letters):
+    mask = 0
+    for letter in letters:
+        mask |= 1 << (letter if not isinstance(letter, str) else ord(letter) - ord("a"))
+    return mask
+
+#best_word: The vectorized version of the scoring loop shared by the guessers - it scores each candidate by how many of the chosen letters it contains (the number of bits its letter mask has in common with the chosen letters) and returns the first one with the top score, just like max() over the dict does.
+    #parameters: candidates - a CandidateSet; letters - list of letter numbers (a = 0 through z = 25) to score with
+    #returns: the guessword
+def best_word(candidates, letters):
+    scores = popcount(candidates.engine["letter_masks"][candidates.indices] & np.uint32(letter_mask(letters)))
+    return candidates[int(np.argmax(scores))]
+
+#####Constraint index#####
+#Another way of trimming candidate sets. Instead of working out the comparison of the guessword against every candidate, each bit of feedback gets turned into a rule about the keyword and the rules get checked against precomputed sets of words. To match compare_words exactly (repeated letters and all), for a guessword letter L with g green spots:
+#   green at position i - the keyword has L at position i
+#   yellow or grey at position i - the keyword doesn't have L at position i
+#   yellow anywhere - the keyword has at least g + 1 L's (compare_words only calls it yellow if there's an L left over in the keyword's non-green spots)
+#   grey anywhere - the keyword has at most g L's
+#Feedback that can't happen (like L both yellow and grey) just leaves no words. The word sets are bitsets (np.packbits, one bit per word in the engine's word list) so each rule is one & over (number of words)/8 bytes.
+
+#build_constraint_index: Builds the bitsets for the constraint index - positions[i, letter] has the words with that letter at position i, and at_least[letter, c] has the words with at least c of that letter.
+    #parameters: engine
+    #returns: the index, as a dict
+def build_constraint_index(engine):
+    codes = engine["codes"]
+    word_length = engine["word_length"]
+    letters = np.arange(26, dtype = np.uint8)
+    positions = np.stack([np.packbits(codes[:, i][None, :] == letters[:, None], axis = 1, bitorder = "little") for i in range(0, word_length)])
+    counts = engine["letter_counts"].T #letters x words
+    at_least = np.stack([np.packbits(counts[letter][None, :] >= np.arange(0, word_length + 2)[:, None], axis = 1, bitorder = "little") for letter in range(0, 26)])
+    return {"positions": positions, "at_least": at_least}
+
+#feedback_constraints: Turns one guess's feedback into the bitset of every word in the engine that would have given that feedback.
+    #parameters: engine - with a constraint index; guessword; compare - the feedback, as from compare_words
+    #returns: the bitset
+def feedback_constraints(engine, guessword, compare):
+    index = engine["constraints"]
+    letters = [ord(letter) - ord("a") for letter in guessword]
+    bits = index["at_least"][0, 0].copy() #every word
+    greens = dict()
+    for i, letter in enumerate(letters):
+        if compare[i] == 2:
+            bits &= index["positions"][i, letter]
+            greens[letter] = greens.get(letter, 0) + 1
+        else:
+            bits &= ~index["positions"][i, letter]
+    for i, letter in enumerate(letters):
+        if compare[i] == 1:
+            bits &= index["at_least"][letter, greens.get(letter, 0) + 1]
+        elif compare[i] == 0:
+            bits &= ~index["at_least"][letter, greens.get(letter, 0) + 1]
+    return bits
+
+#constraint_filter: The constraint index version of trimming a candidate set.
+    #parameters: candidates - a CandidateSet whose engine has a constraint index; guessword; compare
+    #returns: the positions of the candidates that are left
+def constraint_filter(candidates, guessword, compare):
+    bits = feedback_constraints(candidates.engine, guessword, compare)
+    indices = candidates.indices
+    return indices[((bits[indices >> 3] >> (indices & 7).astype(np.uint8)) & 1).astype(bool)]
+
+#parse_feedback: Reads feedback typed in by a person, either as numbers like compare_words gives (e.g. 20110) or as letters (g for green, y for yellow, and b, x, - or . for grey).
+    #parameters: text; word_length
+    #returns: the feedback as a list, or None if it doesn't make sense
+def parse_feedback(text, word_length):
+    values = {"2": 2, "g": 2, "1": 1, "y": 1, "0": 0, "b": 0, "x": 0, "-": 0, ".": 0}
+    text = text.strip().lower().replace(" ", "").replace(",", "")
+    if len(text) != word_length or any(char not in values for char in text):
+        return None
+    return [values[char] for char in text]
+
+#filter_candidates: Gets the words that fit a list of guesses and their feedback.
+    #parameters: engine; clues - list of [guessword, compare] pairs
+    #returns: a CandidateSet of the words that are left
+def filter_candidates(engine, clues):
+    candidates = candidate_set(engine)
+    for guessword, compare in clues:
+        candidates = trim_dict(candidates, guessword, compare, engine["word_length"])
+    return candidates
+
+#####Compiled dictionary cache#####
+#Reading and filtering the text files over and over gets old fast (computer_benchmark_dictionaries loads five of them every run). These functions save the filtered word list, and optionally the feedback matrix, as .npy files named after the source file's hash and the word length, so a changed file automatically gets recompiled. They're opened with memory-mapping, so repeat runs start almost instantly and separate processes reading the same files share the same memory.
+
+#file_hash: Hashes the contents of a file, so that cached results can be matched up with the exact file they came from.
+    #parameters: filename
+    #returns: the hex digest of the file contents
+def file_hash(filename):
+    digest = hashlib.sha1()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+#pack_words: Packs a list of words into a uint8 array, one row of character bytes per word. Returns None if that can't be done (e.g. a word that isn't word_length bytes long).
+    #parameters: dictionary; word_length
+    #returns: a uint8 array of shape (number of words, word_length), or None
+def pack_words(dictionary, word_length):
+    packed = "".join(dictionary).encode("utf-8")
+    if len(packed) != len(dictionary) * word_length:
+        return None
+    return np.frombuffer(packed, dtype = np.uint8).reshape(len(dictionary), word_length)
+
+#unpack_words: Undoes pack_words.
+    #parameters: packed - array from pack_words
+    #returns: the dictionary as a list
+def unpack_words(packed):
+    word_length = packed.shape[1]
+    text = np.ascontiguousarray(packed).tobytes().decode("utf-8")
+    return [text[i:i + word_length] for i in range(0, len(text), word_length)]
+
+#save_array: Saves a numpy array to a .npy file by writing to a temporary file first and then renaming it, so that another process never sees a half-written file.
+    #parameters: path; array
+    #returns: none
+def save_array(path, array):
+    temp_path = "%s.%d.tmp" % (path, os.getpid())
+    with open(temp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(temp_path, path)
+
+#compile_words: Makes sure the compiled version of a dictionary file exists in the cache, compiling it if needed.
+    #parameters: filename; word_length; cache_dir - defaults to CACHE_DIR; feedback - whether to also compile the feedback matrix; doprint - whether to print updates
+    #returns: a list of the paths to the compiled words and feedback matrix, or None if the dictionary can't be compiled
+def compile_words(filename, word_length, cache_dir = None, feedback = False, doprint = True):
+    if cache_dir is None:
+        cache_dir = CACHE_DIR
+    if not cache_dir:
+        return None
+    name = "%s-%s-%d" % (os.path.basename(filename), file_hash(filename), word_length)
+    words_path = os.path.join(cache_dir, name + ".words.npy")
+    feedback_path = os.path.join(cache_dir, name + ".feedback.npy")
+    if not os.path.exists(words_path):
+        if doprint: print("Compiling dictionary...")
+        packed = pack_words(load_words(filename, word_length, doprint = False, cache_dir = False), word_length)
+        if packed is None:
+            return None
+        os.makedirs(cache_dir, exist_ok = True)
+        save_array(words_path, packed)
+    if feedback and not os.path.exists(feedback_path):
+        if doprint: print("Compiling feedback matrix...")
+        codes = np.load(words_path) - ord("a")
+        temp_path = "%s.%d.tmp.npy" % (feedback_path, os.getpid()) #built right in the cache folder rather than in memory, then renamed like save_array does
+        feedback_matrix(codes, word_length, temp_path, doprint = False)
+        os.replace(temp_path, feedback_path)
+    return [words_path, feedback_path]
+
+#load_compiled: Loads an engine (see build_engine) from the cache, compiling it first if needed. The feedback matrix is memory-mapped rather than read in.
+    #parameters: filename; word_length; cache_dir - defaults to CACHE_DIR; feedback - whether the engine should include the feedback matrix; doprint - whether to print updates
+    #returns: the engine
+@profiled("load")
+def load_compiled(filename, word_length, cache_dir = None, feedback = True, doprint = True):
+    paths = compile_words(filename, word_length, cache_dir, feedback, doprint)
+    if paths is None:
+        raise ValueError("Can't compile %s at word length %d - is the cache folder set?" % (filename, word_length))
+    engine = build_engine(unpack_words(np.load(paths[0], mmap_mode = "r")), word_length, feedback = False, doprint = doprint)
+    if feedback:
+        engine["matrix"] = np.load(paths[1], mmap_mode = "r")
+    return engine
+
 #####Functions used to form a new guessword#####
 #Note - this doesn't include the random guesser because that's just a one-liner
 
 #guess_max: This guesser uses the principle that the guessword should contain as many of the most frequently appearing letters left in the dictionary (again, here to mean the source of guesswords). Note that the guessword needn't necessarily contain all n of the top occurring letters - it just tries to get as many as possible. When there are multiple equally valid options, it just selects the first one rather than randomly choosing (see below on guess_half for explanation).
     #parameters: dictionary of source guesswords (this will be progressively trimmed by trim_dict); word_length
     #returns: a guessword as above
+@profiled("guess_max")
 def guess_max(dictionary, word_length):
+    if isinstance(dictionary, CandidateSet):
+        return best_word(dictionary, np.argsort(-letter_frequencies(dictionary), kind = "stable")[0:word_length]) #a stable sort keeps the same order as sorted() for tied letters
     topn = list(dict(sorted(count_chars(dictionary).items(), key = lambda t: t[1], reverse = True)[0:word_length]).keys()) #ake the output of count_chars, sort it from highest to lowest by frequency, take the top n keys (n being the word length), and get a list out of it
     dictionary_count = dict.fromkeys(dictionary, 0) #Run through the dictionary and count how many times each word has one of those top letters
     for word in dictionary:
@@ -82,7 +582,10 @@ def guess_max(dictionary, word_length):
 #guess_half: This guesser uses what I think of as the "Guess Who" principle - try to use letters that are as close to 50% frequency in the dictionary so you can split your list in half (kinda). So this takes the top n letters whose frequency is closest to 50%. At first, this will invariably also be the most common letters, but as your dictionary shrinks this won't be the case. As with guess_max above, it also just takes the guessword that has the most of your n selected letters, rather than randomly selecting between all equally valid options. I actually initially implemented a random selector (the code is below, commented out), but found that it didn't perform better, and I liked the determinism of this approach (it meant that I could pick out some common strategies).
     #parameters: dictionary of source guesswords (this will be progressively trimmed by trim_dict); word_length
     #returns: a guessword as above
+@profiled("guess_half")
 def guess_half(dictionary, word_length):
+    if isinstance(dictionary, CandidateSet):
+        return best_word(dictionary, np.argsort(np.abs(letter_frequencies(dictionary) - 0.5), kind = "stable")[0:word_length])
     count_half = {k: abs(v-0.5) for k,v in count_chars(dictionary).items()} #subtract off 0.5 and take the absolute value to find the letters closest to 50% frequency
     topn = list(dict(sorted(count_half.items(), key = lambda t: t[1])[0:word_length]).keys()) #same as in guess_max but here taking the min n
     dictionary_count = dict.fromkeys(dictionary, 0)
@@ -112,7 +615,18 @@ def guess_half(dictionary, word_length):
 #guess_sacrifice: This actually functions very similar to guess_max, because in the absence of sacrifice guessing, guess_max does better than random guessing (but about the same as guess_half, tbh). The logic is to first sort the list of letters by descending frequency, as in guess_max. But then you remove all of the letters from an input list, which will end up being the list of letters that have already been previously guessed. Then you take the top n letters, and try to form a guessword. Note that because you won't always use every one of these n letters in the guessword, you may end up repeating an old letter in the guessword - which is fine! The idea is to maximize new letters.
     #parameters: dictionary of source guesswords, letters_used - a list of all of the letters that should be removed from consideration (because they have already been guessed); word_length
     #returns: a guessword as above
+@profiled("guess_sacrifice")
 def guess_sacrifice(dictionary, letters_used, word_length):
+    if isinstance(dictionary, CandidateSet): #sacrifice guesses always come from the whole dictionary, so its letter order only gets worked out once
+        engine = dictionary.engine
+        if dictionary.indices is engine["all"]:
+            if engine["letter_order"] is None:
+                engine["letter_order"] = np.argsort(-letter_frequencies(dictionary), kind = "stable")
+            order = engine["letter_order"]
+        else:
+            order = np.argsort(-letter_frequencies(dictionary), kind = "stable")
+        unused = (letter_mask(set(letters_used)) >> order) & 1 == 0
+        return best_word(dictionary, order[unused][0:word_length])
     topn = sorted(count_chars(dictionary).items(), key = lambda t: t[1], reverse = True)
     for letter in list(topn):
         if letter[0] in letters_used:
@@ -125,6 +639,132 @@ def guess_sacrifice(dictionary, letters_used, word_length):
                 dictionary_count[word] += 1
     return max(dictionary_count.items(), key = lambda t: t[1])[0]
 
+#####Information theory guessers#####
+#These two are here as a baseline for the letter-frequency guessers above. For every possible guessword, they count up how the remaining words would be split up by the comparison output (a histogram of the encoded comparisons, done with one big np.bincount), and then pick either the guessword with the most expected information (entropy) or the one whose biggest leftover group is the smallest (minimax). Both need an engine, and both can guess from the whole dictionary rather than just the words that are left - which is much better, but means scoring thousands of guesswords against thousands of keywords on the first turn. That first guess is always the same, though, so it's only worked out once per engine.
+
+#feedback_scores: Scores every guessword in a guess pool against the remaining candidates. Guesswords are done in blocks, so the histograms never get too big.
+    #parameters: candidates - a CandidateSet of the words that are left; guess_pool - a CandidateSet (on the same engine) of the guesswords to score
+    #returns: a list of two arrays - the sum of count * log2(count) over each guessword's histogram (smaller means more information), and the size of the biggest group for each guessword
+def feedback_scores(candidates, guess_pool):
+    engine = candidates.engine
+    word_length = engine["word_length"]
+    patterns = 3**word_length
+    answers = candidates.indices
+    guesses = guess_pool.indices
+    information = np.zeros(len(guesses))
+    worst = np.zeros(len(guesses), dtype = np.int64)
+    block = max(1, block_size() // max(len(answers), patterns))
+    for start in range(0, len(guesses), block):
+        guess_block = guesses[start:start + block]
+        if engine["matrix"] is not None:
+            codes = engine["matrix"][guess_block[:, None], answers]
+        else:
+            codes = feedback_codes(engine["codes"][guess_block], engine["codes"][answers], word_length)
+        counts = np.bincount((codes + (np.arange(len(guess_block)) * patterns)[:, None]).ravel(), minlength = len(guess_block) * patterns).reshape(len(guess_block), patterns) #offsetting each row by its own range of codes makes every row its own histogram
+        information[start:start + block] = (counts * np.log2(np.maximum(counts, 1))).sum(axis = 1)
+        worst[start:start + block] = counts.max(axis = 1)
+    return [information, worst]
+
+#pick_scored_guess: Does the actual work for guess_entropy and guess_minimax. With only one or two words left, it just guesses the first one (nothing can do better). Ties are broken in favor of guesswords that could still be the answer, then by whichever comes first - like the other guessers. Opening guesses get saved in the engine.
+    #parameters: strategy - "entropy" or "minimax"; dictionary - CandidateSet of the words that are left; word_length; guess_pool - CandidateSet of the guesswords to choose from, or None to only guess words that are left (hard mode)
+    #returns: the guessword
+def pick_scored_guess(strategy, dictionary, word_length, guess_pool):
+    if not isinstance(dictionary, CandidateSet):
+        words = list(dict.fromkeys(list(guess_pool or []) + list(dictionary))) #the engine has to cover the guess pool too, and putting it first keeps the pool's order for tie-breaking
+        engine = build_engine(words, word_length, feedback = False, doprint = False)
+        dictionary = candidate_set(engine, list(dictionary))
+        if guess_pool is not None:
+            guess_pool = candidate_set(engine, list(guess_pool))
+    engine = dictionary.engine
+    if guess_pool is None:
+        guess_pool = dictionary
+    elif not isinstance(guess_pool, CandidateSet):
+        guess_pool = candidate_set(engine, guess_pool)
+    if len(dictionary) <= 2:
+        return dictionary[0]
+    opener = None
+    if dictionary.indices is engine["all"]:
+        opener = (strategy, dictionary_fingerprint(guess_pool))
+        if opener in engine["openers"]:
+            return engine["openers"][opener]
+    scores = feedback_scores(dictionary, guess_pool)
+    not_candidate = ~np.isin(guess_pool.indices, dictionary.indices)
+    order = np.arange(len(guess_pool))
+    information = np.round(scores[0], 9) #so that float noise from adding things up in a different order doesn't count as a difference
+    picks = {"entropy": np.lexsort((order, not_candidate, information))[0], "minimax": np.lexsort((order, information, not_candidate, scores[1]))[0]}
+    if opener is not None: #both strategies come out of the same histograms, so save both openers
+        for name in picks:
+            engine["openers"][(name, opener[1])] = guess_pool[int(picks[name])]
+    return guess_pool[int(picks[strategy])]
+
+#guess_entropy: This guesser picks the guessword with the maximum expected information, e.g. the one that splits the remaining words into the most even spread of comparison outputs.
+    #parameters: dictionary of source guesswords (ideally a CandidateSet); word_length; guess_pool - words that are allowed as guesses (e.g. the full dictionary); if not given, only remaining words get guessed
+    #returns: a guessword as above
+@profiled("guess_entropy")
+def guess_entropy(dictionary, word_length, guess_pool = None):
+    return pick_scored_guess("entropy", dictionary, word_length, guess_pool)
+
+#guess_minimax: This guesser picks the guessword that leaves the fewest possible words in the worst case.
+    #parameters: dictionary of source guesswords (ideally a CandidateSet); word_length; guess_pool - words that are allowed as guesses (e.g. the full dictionary); if not given, only remaining words get guessed
+    #returns: a guessword as above
+@profiled("guess_minimax")
+def guess_minimax(dictionary, word_length, guess_pool = None):
+    return pick_scored_guess("minimax", dictionary, word_length, guess_pool)
+
+#####Decision cache for the deterministic guessers#####
+#guess_max, guess_half and guess_sacrifice always give the same guessword for the same remaining dictionary (and letters used, for sacrifice), so every simulated game ends up recalculating the same opening guess and most of the same early guesses. A decision cache remembers recent decisions, keyed on a compact fingerprint of the dictionary, and throws out the least recently used ones once it's full. It's a python dict holding the entries (in an OrderedDict) and hit/miss/eviction counts.
+
+#make_decision_cache: Makes an empty decision cache.
+    #parameters: maxsize - the most decisions to remember at once
+    #returns: the cache
+def make_decision_cache(maxsize = 4096):
+    return {"entries": OrderedDict(), "maxsize": maxsize, "hits": 0, "misses": 0, "evictions": 0}
+
+#dictionary_fingerprint: Boils a dictionary (the list or CandidateSet of remaining guesswords) down to a short digest. Order matters, since the guessers pick the first of any tied words.
+    #parameters: dictionary
+    #returns: the fingerprint as bytes
+def dictionary_fingerprint(dictionary):
+    if isinstance(dictionary, CandidateSet):
+        if dictionary.indices is dictionary.engine["all"]:
+            return dictionary.engine["fingerprint"]
+        return hashlib.blake2b(dictionary.engine["fingerprint"] + np.ascontiguousarray(dictionary.indices).tobytes(), digest_size = 16).digest()
+    return hashlib.blake2b("\n".join(dictionary).encode("utf-8"), digest_size = 16).digest()
+
+#choose_guess: Gets a guessword from one of the deterministic guessers, going through a decision cache if there is one.
+    #parameters: cache - a decision cache or None; guesser - guess_max, guess_half, guess_sacrifice, guess_entropy or guess_minimax; dictionary; word_length; letters_used - only for guess_sacrifice; guess_pool - only for guess_entropy and guess_minimax
+    #returns: the guessword
+def choose_guess(cache, guesser, dictionary, word_length, letters_used = None, guess_pool = None):
+    if cache is None:
+        return call_guesser(guesser, dictionary, word_length, letters_used, guess_pool)
+    key = (guesser.__name__, word_length, dictionary_fingerprint(dictionary), None if letters_used is None else "".join(sorted(set(letters_used))), None if guess_pool is None else dictionary_fingerprint(guess_pool)) #guess_sacrifice only checks whether a letter was used, so the set of letters is all that matters
+    entries = cache["entries"]
+    if key in entries:
+        cache["hits"] += 1
+        entries.move_to_end(key)
+        return entries[key]
+    cache["misses"] += 1
+    guessword = call_guesser(guesser, dictionary, word_length, letters_used, guess_pool)
+    entries[key] = guessword
+    if len(entries) > cache["maxsize"]:
+        entries.popitem(last = False)
+        cache["evictions"] += 1
+    return guessword
+
+#call_guesser: Calls a guesser with whichever extra arguments it takes.
+def call_guesser(guesser, dictionary, word_length, letters_used = None, guess_pool = None):
+    if letters_used is not None:
+        return guesser(dictionary, letters_used, word_length)
+    if guess_pool is not None:
+        return guesser(dictionary, word_length, guess_pool)
+    return guesser(dictionary, word_length)
+
+#print_cache_stats: Prints out how well a decision cache did.
+    #parameters: cache
+    #returns: none
+def print_cache_stats(cache):
+    lookups = cache["hits"] + cache["misses"]
+    print("Decision cache:", cache["hits"], "hits,", cache["misses"], "misses,", cache["evictions"], "evictions (hit rate %.1f%%)" % (100 * cache["hits"] / lookups if lookups else 0))
+
 #####Functions used to play a single game in a given mode#####
 
 #play_game_human: Lol did we really need a human vs computer option in my crappy python text interface when there's already a very pretty GUI? Probably not, but this was a good practice of taking user input, plus useful in some very basic testing.
@@ -150,14 +790,47 @@ def play_game_human(word_length, word = "RANDOM", dictionary = "DEFAULT"):
         print(current_compare)
     print("It took you", guess, "guesses to correctly guess the word.")
 
+#play_game_assist: The other way around from play_game_human - you're playing a real game somewhere else, and after each guess you type in what you guessed and the colors you got back, and this tells you which words are still possible (plus what the max guesser would go for next). Just hit enter to stop.
+    #parameters: word_length; dictionary - defaults to the scrabble list that I downloaded from mathspp; engine - optional output of build_engine for the dictionary (one with a constraint index is built if not given); show - how many of the remaining words to print
+    #returns: the CandidateSet of words that are left at the end
+def play_game_assist(word_length, dictionary = "DEFAULT", engine = None, show = 20):
+    print("Playing assist mode! Type feedback as 0/1/2 (like 20110) or as letters (like gbyyb).")
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False, constraints = True)
+    candidates = candidate_set(engine, dictionary)
+    while len(candidates) > 1:
+        guessword = input("What did you guess? ").strip().lower()
+        if guessword == "":
+            break
+        if len(guessword) != word_length or not all("a" <= letter <= "z" for letter in guessword):
+            print("That's not a", word_length, "letter word!")
+            continue
+        compare = parse_feedback(input("What feedback did you get? "), word_length)
+        if compare is None:
+            print("Couldn't read that feedback, try again.")
+            continue
+        candidates = trim_dict(candidates, guessword, compare, word_length)
+        print("There are", len(candidates), "possible words remaining:", " ".join(list(candidates[0:show])) + (" ..." if len(candidates) > show else ""))
+        if len(candidates) > 1:
+            print("The max guesser would guess", guess_max(candidates, word_length))
+    if len(candidates) == 1:
+        print("It has to be", candidates[0])
+    elif len(candidates) == 0:
+        print("No words fit that feedback - double check what you typed in?")
+    return candidates
+
 #play_game_computer_rand: This is computer vs human/computer, using random selection to pick the next guessword. This effectively serves as the control group for all further testing.
-    #parameters: word_length, word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing)
+    #parameters: word_length, word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing); engine - optional output of build_engine for the dictionary, used to look up comparisons instead of recomputing them (one without the feedback matrix is built if not given)
     #returns: the number of guesses it took to solve the puzzle
-def play_game_computer_rand(word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True):
+def play_game_computer_rand(word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None):
     if doprint: print("Playing computer vs computer game, random mode!")
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint)
-    dictionary = list(dictionary) #GAH
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #no feedback matrix, but a candidate set still trims much faster than copying and trimming a plain list
+    dictionary = candidate_set(engine, dictionary) #the game just holds a view of the engine's word list rather than its own copy
     if word == "RANDOM":
         keyword = random.choice(dictionary)
         if doprint: print("A random word has been selected!")
@@ -171,48 +844,52 @@ def play_game_computer_rand(word_length, word = "RANDOM", dictionary = "DEFAULT"
         guessword = random.choice(dictionary) #777 let's goooooooooooooo
         guess += 1
         if doprint: print("Guessword is", guessword)
-        current_compare = compare_words(keyword, guessword, word_length) #update the current_compare
+        current_compare = compare_words(keyword, guessword, word_length, engine) #update the current_compare
         if doprint: print(current_compare)
-        dictionary= trim_dict(dictionary, guessword, current_compare, word_length) #trims the guessing dictionary based on your most recent guess
+        dictionary= trim_dict(dictionary, guessword, current_compare, word_length, engine) #trims the guessing dictionary based on your most recent guess
     if doprint: print("It took the computer", guess, "guesses to correctly guess the word in random mode.")
     return guess
 
 #play_game_computer_max: This is computer vs human/computer, using the guess_max selection to pick the next guessword (e.g. based on most frequently appearing remaining letters). This, of course, functions in hard mode.
-    #parameters: word_length, word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing)
+    #parameters: word_length, word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing); engine - optional output of build_engine for the dictionary, used to look up comparisons instead of recomputing them (one without the feedback matrix is built if not given); cache - optional decision cache (see make_decision_cache) to remember guesswords across games
     #returns: the number of guesses it took to solve the puzzle
-def play_game_computer_max(word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True):
+def play_game_computer_max(word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, cache = None):
     if doprint: print("Playing computer vs computer game, max mode!")
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
-    dictionary = list(dictionary) #GAAAH
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #no feedback matrix, but a candidate set still trims much faster than copying and trimming a plain list
+    dictionary = candidate_set(engine, dictionary) #the game just holds a view of the engine's word list rather than its own copy
     if word == "RANDOM":
         keyword = random.choice(dictionary)
         if doprint: print("A random word has been selected!")
     else:
         keyword = word
         if doprint: print("Using input word!")
-    ifdoprint: print(keyword)
+    if doprint: print(keyword)
     current_compare = [0]*word_length #This is the score for your most recent guess; starts at all 0s
     guess = 0 #number of guesses
     while(current_compare != [2]*word_length):
         if doprint: print("There are", len(dictionary), "possible guesswords remaining")
-        guessword = guess_max(dictionary, word_length) #Now using the max frequency letter approach
+        guessword = choose_guess(cache, guess_max, dictionary, word_length) #Now using the max frequency letter approach
         guess += 1
         if doprint: print("Guessword is", guessword)
-        current_compare = compare_words(keyword, guessword, word_length) #update the current_compare
+        current_compare = compare_words(keyword, guessword, word_length, engine) #update the current_compare
         if doprint: print(current_compare)
-        dictionary= trim_dict(dictionary, guessword, current_compare, word_length) #trims the guessing dictionary based on your most recent guess
+        dictionary= trim_dict(dictionary, guessword, current_compare, word_length, engine) #trims the guessing dictionary based on your most recent guess
     if doprint: print("It took the computer", guess, "guesses to correctly guess the word in max mode.")
     return guess
 
 #play_game_computer_half: This is computer vs human/computer, using the guess_half selection to pick the next guessword (e.g. based on letters whose frequently is closest to 50% in the remaining list - e.g. to try and split the list effectively). This, of course, functions in hard mode.
-    #parameters: word_length, word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing)
+    #parameters: word_length, word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing); engine - optional output of build_engine for the dictionary, used to look up comparisons instead of recomputing them (one without the feedback matrix is built if not given); cache - optional decision cache (see make_decision_cache) to remember guesswords across games
     #returns: the number of guesses it took to solve the puzzle
-def play_game_computer_half(word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True):
+def play_game_computer_half(word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, cache = None):
     if doprint: print("Playing computer vs computer game, halving mode!")
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
-    dictionary = list(dictionary) #GAAAH
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #no feedback matrix, but a candidate set still trims much faster than copying and trimming a plain list
+    dictionary = candidate_set(engine, dictionary) #the game just holds a view of the engine's word list rather than its own copy
     if word == "RANDOM":
         keyword = random.choice(dictionary)
         if doprint: print("A random word has been selected!")
@@ -224,25 +901,44 @@ def play_game_computer_half(word_length, word = "RANDOM", dictionary = "DEFAULT"
     guess = 0 #number of guesses
     while(current_compare != [2]*word_length):
         if doprint: print("There are", len(dictionary), "possible guesswords remaining")
-        guessword = guess_half(dictionary, word_length) #Now using the half frequency letter approach
+        guessword = choose_guess(cache, guess_half, dictionary, word_length) #Now using the half frequency letter approach
         guess += 1
         if doprint: print("Guessword is", guessword)
-        current_compare = compare_words(keyword, guessword, word_length) #update the current_compare
+        current_compare = compare_words(keyword, guessword, word_length, engine) #update the current_compare
         if doprint: print(current_compare)
-        dictionary= trim_dict(dictionary, guessword, current_compare, word_length) #trims the guessing dictionary based on your most recent guess
+        dictionary= trim_dict(dictionary, guessword, current_compare, word_length, engine) #trims the guessing dictionary based on your most recent guess
     if doprint: print("It took the computer", guess, "guesses to correctly guess the word in halving mode.")
     return guess
 
+#sacrifice_choose: The decision half of a sacrifice mode turn, pulled out so that anything that walks through sacrifice games (like computer_exact) makes exactly the same choices as play_game_computer_sacrifice. At or below the threshold you sacrifice guess; above it, it's time to go for the jugular with max guessing.
+    #parameters: dictionary - the words that are left; full_dictionary - the whole, unchanging dictionary that sacrifice guesses come from; letters_used; max_compare - how many letters of the keyword you know so far; prev_guessword - the last sacrifice guess; threshold; word_length; cache - optional decision cache
+    #returns: a list of the guessword and whether it's a sacrifice guess
+def sacrifice_choose(dictionary, full_dictionary, letters_used, max_compare, prev_guessword, threshold, word_length, cache = None):
+    if(max_compare <= threshold):
+        guessword = choose_guess(cache, guess_sacrifice, full_dictionary, word_length, letters_used) #here's where you sacrifice guess
+        if guessword != prev_guessword: #This if statement is to avoid a weird situation that sometimes happened where it would keep guessing the wrong word over and over and over. I didn't quite work out why that happened, this just solved it without much fuss
+            return [guessword, True]
+    return [choose_guess(cache, guess_max, dictionary, word_length), False]
+
+#check_threshold: Makes sure a sacrifice mode threshold is something the guesser can actually use - a whole number of letters from 1 up to the word length - so a bad one gets caught up front rather than blowing up partway through a game.
+    #parameters: threshold; word_length
+    #returns: none, but raises a ValueError if the threshold is no good
+def check_threshold(threshold, word_length):
+    if isinstance(threshold, bool) or not isinstance(threshold, (int, np.integer)) or not 1 <= threshold <= word_length:
+        raise ValueError("Sacrifice mode needs a threshold from 1 to %d, not %r" % (word_length, threshold))
+
 #play_game_computer_sacrifice: This is computer vs human/computer, using sacrifice guessing. The notion of sacrifice guessing is to use a guessword containing previously unused letters (even if some of those letters are in the keyword) to try and maximize your chance of finding remaining letters. The question, however, becomes when to use sacrifice guessing -clearly once you have an idea of the word, you can go straight to try to figure it out using the info you have. In this function, I allow this to be parameterized by a threshold - at or below this threshold, you will sacrifice guess, but above it, you will use the max guessing strategy. The threshold is based on total number of letters that you have guessed so far (regardless of position). Of course, this method won't work in hard mode.
-    #parameters: word_length; threshold - this is the maximum number of letters in the keyword that you can know such that you will still allow sacrifice guesses. Above this threshold, you switch to max guessing. (Why did I make this a less than or equals rather than just less than? Because I'm a dummy); word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing)
+    #parameters: word_length; threshold - this is the maximum number of letters in the keyword that you can know such that you will still allow sacrifice guesses. Above this threshold, you switch to max guessing. (Why did I make this a less than or equals rather than just less than? Because I'm a dummy); word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing); engine - optional output of build_engine for the dictionary, used to look up comparisons instead of recomputing them (one without the feedback matrix is built if not given); cache - optional decision cache (see make_decision_cache) to remember guesswords across games
     #returns: a list where the first item is the number of guesses it took and the second item is the number of sacrifice guesses made
-def play_game_computer_sacrifice(word_length, threshold, word = "RANDOM", dictionary = "DEFAULT", doprint = True):
+def play_game_computer_sacrifice(word_length, threshold, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, cache = None):
     if doprint: print("Playing computer vs computer game, sacrifice mode!")
     if doprint: print("Threshold is", threshold)
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
-    dictionary = list(dictionary) #GAAAAH
-    full_dictionary = list(dictionary) #So this will be a list that DOES NOT CHANGE - that way, you sacrifice guesses can be pulled from the full dictionary and allow you to guess words that you know are wrong but can give more info
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #no feedback matrix, but a candidate set still trims much faster than copying and trimming a plain list
+    dictionary = candidate_set(engine, dictionary) #the game just holds a view of the engine's word list rather than its own copy
+    full_dictionary = dictionary.copy() #So this will be a list that DOES NOT CHANGE - that way, you sacrifice guesses can be pulled from the full dictionary and allow you to guess words that you know are wrong but can give more info
     letters_used = list() #Need this to be able to keep track of what letters you've used and try to avoid them in your sacrifice guesses
     if word == "RANDOM":
         keyword = random.choice(dictionary)
@@ -257,44 +953,394 @@ def play_game_computer_sacrifice(word_length, threshold, word = "RANDOM", dictio
     prev_guessword = "" #use this to keep track of what letters you need to avoid in your sacrifice
     while(current_compare != [2]*word_length):
         if doprint: print("There are", len(dictionary), "possible guesswords remaining")
-        if(max_compare <= threshold):
-            guessword = guess_sacrifice(full_dictionary, letters_used, word_length) #here's where you sacrifice guess
-            if guessword != prev_guessword: #This if statement is to avoid a weird situation that sometimes happened where it would keep guessing the wrong word over and over and over. I didn't quite work out why that happened, this just solved it without much fuss
-                letters_used = letters_used + list(guessword) #add on all the letters from your recent guess to the avoid list
-                sacrifice_guess += 1
-                current_compare = compare_words(keyword, guessword, word_length)
-                max_compare += sum(1 for n in current_compare if n != 0) #This updates how many total letters you now know
-                prev_guessword = guessword
-            else:
-                guessword = guess_max(dictionary, word_length)
-                current_compare = compare_words(keyword, guessword, word_length)
-        else:
-            guessword = guess_max(dictionary, word_length) #If you cross your threshold, time to go for the jugular with max guessing
-            current_compare = compare_words(keyword, guessword, word_length)
+        [guessword, is_sacrifice] = sacrifice_choose(dictionary, full_dictionary, letters_used, max_compare, prev_guessword, threshold, word_length, cache)
+        current_compare = compare_words(keyword, guessword, word_length, engine)
+        if is_sacrifice:
+            letters_used = letters_used + list(guessword) #add on all the letters from your recent guess to the avoid list
+            sacrifice_guess += 1
+            max_compare += sum(1 for n in current_compare if n != 0) #This updates how many total letters you now know
+            prev_guessword = guessword
         guess += 1
         if doprint: print("Guessword is", guessword)
         if doprint: print(current_compare)
-        dictionary= trim_dict(dictionary, guessword, current_compare, word_length) #trim the dictionary whether you sacrifice guessed or not
+        dictionary= trim_dict(dictionary, guessword, current_compare, word_length, engine) #trim the dictionary whether you sacrifice guessed or not
     if doprint: print("It took the computer", guess, "guesses to correctly guess the word in sacrifice mode.")
     if doprint: print("The computer also used", sacrifice_guess, "sacrifice guesses.")
     return [guess, sacrifice_guess]
 
+#play_game_computer_sacrifice_sweep: Plays sacrifice mode for a whole list of thresholds at once. Games with different thresholds are exactly the same up until the number of letters you know (max_compare) goes above the lowest threshold, so rather than playing each threshold from scratch, this plays one game and only splits it in two when the thresholds disagree - the ones below max_compare go off and max guess (and since max_compare only changes on sacrifice guesses, they never split again), while the rest carry on together. Each threshold comes out exactly the same as play_game_computer_sacrifice would give it.
+    #parameters: word_length; thresholds - list of thresholds; word; dictionary; doprint; engine; cache - same as play_game_computer_sacrifice
+    #returns: a list with the play_game_computer_sacrifice result ([guesses, sacrifice guesses]) for each threshold, in the same order
+def play_game_computer_sacrifice_sweep(word_length, thresholds, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, cache = None):
+    if doprint: print("Playing computer vs computer game, sacrifice mode with thresholds", thresholds)
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #no feedback matrix, but a candidate set still trims much faster than copying and trimming a plain list
+    dictionary = candidate_set(engine, dictionary) #the game just holds a view of the engine's word list rather than its own copy
+    full_dictionary = dictionary.copy()
+    if word == "RANDOM":
+        keyword = random.choice(dictionary)
+    else:
+        keyword = word
+    results = [None] * len(thresholds)
+    #Each branch is [positions in thresholds that it covers, dictionary, letters_used, max_compare, guess, sacrifice_guess, prev_guessword], and the starting one covers everything
+    branches = [[list(range(0, len(thresholds))), dictionary, list(), 0, 0, -1, ""]]
+    while len(branches) > 0:
+        [members, dictionary, letters_used, max_compare, guess, sacrifice_guess, prev_guessword] = branches.pop()
+        sacrificing = [i for i in members if max_compare <= thresholds[i]]
+        maxing = [i for i in members if max_compare > thresholds[i]]
+        if len(sacrificing) > 0 and len(maxing) > 0: #the thresholds disagree, so the max guessers split off into their own game
+            branches.append([maxing, dictionary.copy(), list(letters_used), max_compare, guess, sacrifice_guess, prev_guessword])
+            members = sacrificing
+        threshold = thresholds[members[0]] #every threshold left in this branch makes the same choice
+        [guessword, is_sacrifice] = sacrifice_choose(dictionary, full_dictionary, letters_used, max_compare, prev_guessword, threshold, word_length, cache)
+        current_compare = compare_words(keyword, guessword, word_length, engine)
+        if is_sacrifice:
+            letters_used = letters_used + list(guessword)
+            sacrifice_guess += 1
+            max_compare += sum(1 for n in current_compare if n != 0)
+            prev_guessword = guessword
+        if _profile is not None: #branches take turns, so keep the profile's turn count and thresholds on this one
+            _profile["turn"] = guess
+            _profile["mode"] = ["sacrifice T%s" % thresholds[i] for i in members]
+        guess += 1
+        dictionary = trim_dict(dictionary, guessword, current_compare, word_length, engine) #trimmed even on the winning guess, like play_game_computer_sacrifice does
+        if current_compare == [2]*word_length:
+            for i in members:
+                results[i] = [guess, sacrifice_guess]
+            continue
+        branches.append([members, dictionary, letters_used, max_compare, guess, sacrifice_guess, prev_guessword])
+    if doprint:
+        for i in range(0, len(thresholds)):
+            print("Threshold", thresholds[i], "took", results[i][0], "guesses with", results[i][1], "sacrifice guesses.")
+    return results
+
+#play_game_computer_entropy: This is computer vs human/computer, using the guess_entropy selection to pick the next guessword (e.g. the guessword with the most expected information). By default, guesswords can come from the whole dictionary rather than just the words that are left, so this doesn't play in hard mode.
+    #parameters: word_length, word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing); engine - optional output of build_engine for the dictionary (one without the feedback matrix is built if not given, since this mode needs one); cache - optional decision cache (see make_decision_cache) to remember guesswords across games; guess_pool - "full" to guess from the whole dictionary, or "candidates" to only guess words that are left (faster, and hard mode)
+    #returns: the number of guesses it took to solve the puzzle
+def play_game_computer_entropy(word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, cache = None, guess_pool = "full"):
+    if doprint: print("Playing computer vs computer game, entropy mode!")
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    dictionary = candidate_set(engine, dictionary)
+    full_dictionary = dictionary.copy() if guess_pool == "full" else None
+    if word == "RANDOM":
+        keyword = random.choice(dictionary)
+        if doprint: print("A random word has been selected!")
+    else:
+        keyword = word
+        if doprint: print("Using input word!")
+    current_compare = [0]*word_length #This is the score for your most recent guess; starts at all 0s
+    guess = 0 #number of guesses
+    while(current_compare != [2]*word_length):
+        if doprint: print("There are", len(dictionary), "possible guesswords remaining")
+        guessword = choose_guess(cache, guess_entropy, dictionary, word_length, guess_pool = full_dictionary)
+        guess += 1
+        if doprint: print("Guessword is", guessword)
+        current_compare = compare_words(keyword, guessword, word_length, engine) #update the current_compare
+        if doprint: print(current_compare)
+        dictionary = trim_dict(dictionary, guessword, current_compare, word_length) #trims the guessing dictionary based on your most recent guess
+    if doprint: print("It took the computer", guess, "guesses to correctly guess the word in entropy mode.")
+    return guess
+
+#play_game_computer_minimax: This is computer vs human/computer, using the guess_minimax selection to pick the next guessword (e.g. the guessword whose worst case leaves the fewest words). By default, guesswords can come from the whole dictionary rather than just the words that are left, so this doesn't play in hard mode.
+    #parameters: word_length, word - if not given, this selects randomly from the dictionary, but can also be input by the user; dictionary - this is the source of keywords and also the eventual source of guesswords. Defaults to the scrabble list that I downloaded from mathspp; doprint - determines whether to print stuff (can be turned off for large n testing); engine - optional output of build_engine for the dictionary (one without the feedback matrix is built if not given, since this mode needs one); cache - optional decision cache (see make_decision_cache) to remember guesswords across games; guess_pool - "full" to guess from the whole dictionary, or "candidates" to only guess words that are left (faster, and hard mode)
+    #returns: the number of guesses it took to solve the puzzle
+def play_game_computer_minimax(word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, cache = None, guess_pool = "full"):
+    if doprint: print("Playing computer vs computer game, minimax mode!")
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    dictionary = candidate_set(engine, dictionary)
+    full_dictionary = dictionary.copy() if guess_pool == "full" else None
+    if word == "RANDOM":
+        keyword = random.choice(dictionary)
+        if doprint: print("A random word has been selected!")
+    else:
+        keyword = word
+        if doprint: print("Using input word!")
+    current_compare = [0]*word_length #This is the score for your most recent guess; starts at all 0s
+    guess = 0 #number of guesses
+    while(current_compare != [2]*word_length):
+        if doprint: print("There are", len(dictionary), "possible guesswords remaining")
+        guessword = choose_guess(cache, guess_minimax, dictionary, word_length, guess_pool = full_dictionary)
+        guess += 1
+        if doprint: print("Guessword is", guessword)
+        current_compare = compare_words(keyword, guessword, word_length, engine) #update the current_compare
+        if doprint: print(current_compare)
+        dictionary = trim_dict(dictionary, guessword, current_compare, word_length) #trims the guessing dictionary based on your most recent guess
+    if doprint: print("It took the computer", guess, "guesses to correctly guess the word in minimax mode.")
+    return guess
+
+#####Plotting and result output#####
+
+#load_pyplot, load_pandas, load_seaborn: Import the plotting/dataframe libraries the first time something asks for them.
+def load_pyplot():
+    from matplotlib import pyplot as plt
+    return plt
+
+def load_pandas():
+    import pandas as pd
+    return pd
+
+def load_seaborn():
+    import seaborn as sns
+    return sns
+
+#The columns of a per-game record
+RECORD_FIELDS = ["library", "word_length", "method", "threshold", "keyword", "guesses", "sacrifices", "success"]
+
+#keyword_records: Turns the results of playing jobs on one keyword (see play_keywords) into per-game records, one python dict per game.
+    #parameters: jobs - list of [method, threshold] pairs; word_length; keyword; results - the results of each job; library - optional name of the dictionary, to tell records from different dictionaries apart
+    #returns: list of records
+def keyword_records(jobs, word_length, keyword, results, library = None):
+    records = list()
+    for job, result in zip(jobs, results):
+        [guesses, sacrifices] = result if isinstance(result, list) else [result, None] #sacrifice mode gives [guesses, sacrifices], everything else just guesses
+        records.append({"library": library, "word_length": word_length, "method": job[0], "threshold": job[1], "keyword": keyword, "guesses": guesses, "sacrifices": sacrifices, "success": guesses <= 6})
+    return records
+
+#open_records: Opens somewhere to put per-game records. With a path, records get streamed straight to the file as they come in - JSON Lines (.jsonl), CSV (.csv) or Parquet (.parquet, needs pyarrow; written in batches) depending on the extension - so even millions of games never have to sit in memory. Any file already at the path gets overwritten (to pick a run back up where it left off, use open_checkpoint instead). Without a path, they're just kept in a list.
+    #parameters: path - file to write to, or None to keep the records in memory
+    #returns: the record stream (a python dict)
+def open_records(path = None):
+    stream = {"path": path, "records": list(), "file": None, "writer": None}
+    if path is None:
+        stream["format"] = "list"
+    elif path.endswith(".jsonl") or path.endswith(".json"):
+        stream["format"] = "jsonl"
+        stream["file"] = open(path, "w")
+    elif path.endswith(".csv"):
+        stream["format"] = "csv"
+        stream["file"] = open(path, "w", newline = "")
+        stream["writer"] = csv.DictWriter(stream["file"], fieldnames = RECORD_FIELDS)
+        stream["writer"].writeheader()
+    elif path.endswith(".parquet"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        stream["format"] = "parquet"
+        stream["schema"] = pa.schema([("library", pa.string()), ("word_length", pa.int64()), ("method", pa.string()), ("threshold", pa.int64()), ("keyword", pa.string()), ("guesses", pa.int64()), ("sacrifices", pa.int64()), ("success", pa.bool_())])
+        stream["writer"] = pq.ParquetWriter(path, stream["schema"])
+    else:
+        raise ValueError("Don't know how to write records to %s - use .jsonl, .csv or .parquet" % path)
+    return stream
+
+#write_record: Adds one record to a record stream.
+    #parameters: stream - from open_records; record - a python dict with the RECORD_FIELDS
+    #returns: none
+def write_record(stream, record):
+    if stream["format"] == "jsonl":
+        stream["file"].write(json.dumps(record) + "\n")
+    elif stream["format"] == "checkpoint": #checkpoint logs get flushed after every record and also remember what's been done (see open_checkpoint)
+        stream["file"].write(json.dumps(record) + "\n")
+        stream["file"].flush()
+        stream["records"].append(record)
+        stream["done"].add((record["library"], record["word_length"], record["method"], record["threshold"], record["keyword"]))
+    elif stream["format"] == "csv":
+        stream["writer"].writerow(record)
+    else:
+        stream["records"].append(record)
+        if stream["format"] == "parquet" and len(stream["records"]) >= 65536:
+            flush_records(stream)
+
+#flush_records: Pushes anything buffered in a record stream out to its file.
+    #parameters: stream
+    #returns: none
+def flush_records(stream):
+    if stream["format"] == "parquet" and len(stream["records"]) > 0:
+        import pyarrow as pa
+        stream["writer"].write_table(pa.Table.from_pylist(stream["records"], schema = stream["schema"]))
+        stream["records"] = list()
+    elif stream["file"] is not None:
+        stream["file"].flush()
+
+#close_records: Finishes off a record stream.
+    #parameters: stream
+    #returns: the records, if they were being kept in memory, otherwise None
+def close_records(stream):
+    flush_records(stream)
+    if stream["format"] == "parquet":
+        stream["writer"].close()
+    if stream["file"] is not None:
+        stream["file"].close()
+    return stream["records"] if stream["format"] in ["list", "checkpoint"] else None
+
+#####Functions for playing a whole list of keywords, either one after another or spread over multiple processes#####
+
+#Holds the dictionary and engine inside each worker process (see play_keywords), so they only have to get to each worker once instead of with every game
+_worker_state = None
+
+#play_game_method: Plays a single game in whichever computer mode is named, so that a mode can be passed around as data.
+    #parameters: method - "rand", "max", "half", "sacrifice", "sacrifice_sweep", "entropy" or "minimax"; word_length; word; dictionary; doprint; engine; threshold - only used for sacrifice mode (a list of them for sacrifice_sweep); cache - decision cache (not used in random mode)
+    #returns: whatever that mode's play_game_computer function returns
+def play_game_method(method, word_length, word, dictionary, doprint = False, engine = None, threshold = None, cache = None):
+    if _profile is not None: #time the whole game and start counting its turns
+        if method == "sacrifice_sweep": #counted as a game of each threshold, so the turn by turn sizes come out the same as playing them one at a time
+            mode = ["sacrifice T%s" % t for t in threshold]
+        else:
+            mode = method if threshold is None else "%s T%s" % (method, threshold)
+        previous = _profile["mode"]
+        _profile["mode"] = mode
+        _profile["turn"] = 0
+        for name in mode if isinstance(mode, list) else [mode]:
+            _profile["games"][name] = _profile["games"].get(name, 0) + 1
+        if not isinstance(dictionary, str): profile_size(len(dictionary))
+        start = time.perf_counter()
+        result = play_game_method_unprofiled(method, word_length, word, dictionary, doprint, engine, threshold, cache)
+        profile_time("game " + (method if isinstance(mode, list) else mode), time.perf_counter() - start)
+        _profile["mode"] = previous
+        return result
+    return play_game_method_unprofiled(method, word_length, word, dictionary, doprint, engine, threshold, cache)
+
+#play_game_method_unprofiled: Does the actual work for play_game_method.
+def play_game_method_unprofiled(method, word_length, word, dictionary, doprint = False, engine = None, threshold = None, cache = None):
+    if method == "rand":
+        return play_game_computer_rand(word_length, word, dictionary, doprint, engine)
+    if method == "max":
+        return play_game_computer_max(word_length, word, dictionary, doprint, engine, cache)
+    if method == "half":
+        return play_game_computer_half(word_length, word, dictionary, doprint, engine, cache)
+    if method == "sacrifice":
+        return play_game_computer_sacrifice(word_length, threshold, word, dictionary, doprint, engine, cache)
+    if method == "sacrifice_sweep":
+        return play_game_computer_sacrifice_sweep(word_length, threshold, word, dictionary, doprint, engine, cache)
+    if method == "entropy":
+        return play_game_computer_entropy(word_length, word, dictionary, doprint, engine, cache)
+    if method == "minimax":
+        return play_game_computer_minimax(word_length, word, dictionary, doprint, engine, cache)
+    raise ValueError("Unknown method: %s" % method)
+
+#play_keyword_jobs: Plays every job (a [method, threshold] pair) on one keyword. If a seed is given, the random module gets reseeded from the seed and the keyword first, so the keyword's games come out the same no matter which process plays them or in what order, and is put back the way it was afterwards. A keyword that comes up again in the same list gets the repeat number mixed into its seed too, so it plays a fresh random game rather than a copy of the first one. When there's more than one sacrifice job, they all get played together with play_game_computer_sacrifice_sweep, which gives the same results for a lot less work.
+    #parameters: jobs - list of [method, threshold] pairs; word_length; keyword; dictionary; doprint; engine; seed; cache - decision cache; repeat - how many times the keyword has already been played in this list (see keyword_repeats)
+    #returns: list with the result of each job
+def play_keyword_jobs(jobs, word_length, keyword, dictionary, doprint, engine, seed, cache = None, repeat = 0):
+    if seed is None:
+        return play_seeded_jobs(jobs, word_length, keyword, dictionary, doprint, engine, cache)
+    state = random.getstate() #so that the caller's own random numbers don't change just because a sim ran in between
+    random.seed("%s:%s" % (seed, keyword) if repeat == 0 else "%s:%s:%d" % (seed, keyword, repeat)) #the first time a keyword comes up keeps the same seed it always had
+    try:
+        return play_seeded_jobs(jobs, word_length, keyword, dictionary, doprint, engine, cache)
+    finally:
+        random.setstate(state)
+
+#play_seeded_jobs: The part of play_keyword_jobs that actually plays the jobs, once the random module has been seeded.
+def play_seeded_jobs(jobs, word_length, keyword, dictionary, doprint, engine, cache):
+    thresholds = [job[1] for job in jobs if job[0] == "sacrifice"]
+    sweep = None #worked out when the first sacrifice job comes up, so the games still get played in the same order
+    results = list()
+    for job in jobs:
+        if job[0] == "sacrifice" and len(thresholds) > 1:
+            if sweep is None:
+                sweep = play_game_method("sacrifice_sweep", word_length, keyword, dictionary, doprint, engine, thresholds, cache)
+            results.append(sweep[thresholds.index(job[1])])
+        else:
+            results.append(play_game_method(job[0], word_length, keyword, dictionary, doprint, engine, job[1], cache))
+    return results
+
+#keyword_repeats: Counts, for each keyword in a list, how many times it's already come up earlier in the list.
+    #parameters: word - list of keywords
+    #returns: list of counts, one per keyword
+def keyword_repeats(word):
+    seen = dict()
+    repeats = list()
+    for keyword in word:
+        repeats.append(seen.get(keyword, 0))
+        seen[keyword] = repeats[-1] + 1
+    return repeats
+
+#_init_worker: Sets up _worker_state in a worker process. Only needed when processes can't be forked (e.g. on Windows/macOS) - a memory-mapped feedback matrix is sent as its filename and reopened, so workers still share it.
+def _init_worker(state):
+    global _worker_state
+    if state["engine"] is not None and isinstance(state["engine"]["matrix"], str):
+        state["engine"] = dict(state["engine"], matrix = np.load(state["engine"]["matrix"], mmap_mode = "r"))
+    _worker_state = state
+
+#_play_chunk: What each worker process actually runs - plays the jobs for a chunk of keywords. Each worker has its own copy of the decision cache, so this also sends back how much the cache counts went up by, along with a profile of just this chunk if profiling is on.
+def _play_chunk(chunk):
+    state = _worker_state
+    cache = state["cache"]
+    before = None if cache is None else [cache["hits"], cache["misses"], cache["evictions"]]
+    profile = make_profile() if state["profile"] else None
+    previous = use_profile(profile)
+    results = [[i, play_keyword_jobs(state["jobs"], state["word_length"], keyword, state["dictionary"], state["doprint"], state["engine"], state["seed"], cache, repeat)] for i, keyword, repeat in chunk]
+    use_profile(previous)
+    return [results, None if cache is None else [cache["hits"] - before[0], cache["misses"] - before[1], cache["evictions"] - before[2]], profile]
+
+#play_keywords: Plays a list of jobs on every keyword in a list. This is what the sims and benchmarks use to actually play their games. With workers, the keywords are split up into chunks and handed out to a pool of processes. The dictionary and engine are handed to each worker once (for free when processes are forked) rather than sent with every chunk, and every keyword gets its own seed so that the results are the same for any number of workers (a repeated keyword gets a different seed each time it comes up, so its games are still independent).
+    #parameters: jobs - list of [method, threshold] pairs, e.g. [["max", None], ["sacrifice", 2]]; word_length; word - list of keywords; dictionary; doprint; engine; workers - number of processes to use (None or 1 plays everything in this process); seed - seed for each keyword's games. Only used in serial mode if given, and taken from the random module if not given in parallel mode; cache - decision cache shared by all the games (in parallel mode, each worker gets its own copy and the counts are added back up here); records - optional record stream (see open_records) that every game gets written to as soon as it's done; library - dictionary name to put in those records; progress - whether to print the running count of keywords
+    #returns: a list with one entry per keyword, each a list with the result of each job
+def play_keywords(jobs, word_length, word, dictionary, doprint = False, engine = None, workers = None, seed = None, cache = None, records = None, library = None, progress = True):
+    n = len(word)
+    results = [None]*n
+    repeats = keyword_repeats(word)
+    if workers is None or workers <= 1 or n <= 1:
+        for i in range(0, n):
+            if progress: print(i+1, end = " ")
+            results[i] = play_keyword_jobs(jobs, word_length, word[i], dictionary, doprint, engine, seed, cache, repeats[i])
+            if records is not None:
+                for record in keyword_records(jobs, word_length, word[i], results[i], library): write_record(records, record)
+        return results
+    global _worker_state
+    if seed is None:
+        seed = random.getrandbits(64) #so that seeding the random module beforehand still makes the whole run reproducible
+    state = {"jobs": jobs, "word_length": word_length, "dictionary": dictionary, "doprint": doprint, "engine": engine, "seed": seed, "cache": cache, "profile": _profile is not None}
+    chunk_size = max(1, -(-n // (workers * 4))) #a few chunks per worker, so a slow chunk doesn't hold everything up
+    chunks = [list(zip(range(0, n), word, repeats))[start:start + chunk_size] for start in range(0, n, chunk_size)]
+    if "fork" in multiprocessing.get_all_start_methods():
+        _worker_state = state #forked workers inherit this as-is, no pickling needed
+        pool = ProcessPoolExecutor(workers, mp_context = multiprocessing.get_context("fork"))
+    else:
+        if engine is not None and isinstance(engine["matrix"], np.memmap):
+            state["engine"] = dict(engine, matrix = engine["matrix"].filename)
+        pool = ProcessPoolExecutor(workers, initializer = _init_worker, initargs = (state,))
+    try:
+        done = 0
+        for future in as_completed([pool.submit(_play_chunk, chunk) for chunk in chunks]):
+            chunk_results, cache_counts, chunk_profile = future.result()
+            for i, result in chunk_results:
+                results[i] = result
+                done += 1
+                if progress: print(done, end = " ")
+                if records is not None:
+                    for record in keyword_records(jobs, word_length, word[i], result, library): write_record(records, record)
+            if chunk_profile is not None:
+                merge_profile(_profile, chunk_profile)
+            if cache_counts is not None:
+                cache["hits"] += cache_counts[0]
+                cache["misses"] += cache_counts[1]
+                cache["evictions"] += cache_counts[2]
+    finally:
+        pool.shutdown()
+        _worker_state = None
+    return results
+
 #####Functions that allow you to run a single mode multiple times (for simulations)#####
 
 #computer_rand_sim: This simulates games of the random mode guesser.
-    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games
-    #returns: none
-def computer_rand_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True):
+    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games; engine - optional output of build_engine for the dictionary, passed on to each game (if not given, one without the feedback matrix is built); workers - number of processes to play the games on (None plays them one after another); seed - makes each keyword's games reproducible (see play_keywords); plot - set to False to skip all the plotting and printing and just get the per-game records back; output - optional .jsonl, .csv or .parquet file to stream the per-game records to as they're played; profile - optional profile (see make_profile) that gets filled in with where the time went. It's printed at the end, and saved next to output as <output>.profile.json
+    #returns: none, or with plot = False, the list of per-game records (see keyword_records), or None if they went to output
+def computer_rand_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, workers = None, seed = None, plot = True, output = None, profile = None):
+    previous = use_profile(profile) #no-op unless a profile was given
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #cheap without the feedback matrix, and means every game can use candidate sets
     if word == "RANDOM":
         word = random.sample(dictionary, n)
     else: 
         n = len(word)
-    guess_sim = [0]*n #number of guesses for each word in the list
-    for i in range(0, n):
-        print(i+1, end = " ")
-        guess_sim[i] = play_game_computer_rand(word_length, word[i], dictionary, doprint)
+    records = None if plot and output is None else open_records(output) #where the per-game records go, if anywhere
+    guess_sim = [game[0] for game in play_keywords([["rand", None]], word_length, word, dictionary, doprint, engine, workers, seed, None, records, progress = plot)] #number of guesses for each word in the list
+    if records is not None: records = close_records(records)
+    use_profile(previous)
+    if profile is not None and isinstance(output, str): save_profile(profile, output + ".profile.json")
+    if not plot:
+        return records
+    plt = load_pyplot()
     plt.hist(guess_sim, bins = np.arange(0, max(guess_sim) + 2, 1))
     plt.title("Random Guesser, n = %d" % n)
     plt.xlabel("# of Guesses")
@@ -302,21 +1348,30 @@ def computer_rand_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", d
     plt.show()
     print("Average:", mean(guess_sim))
     print("Success %:", (sum(1 for n in guess_sim if n <= 6)/n) * 100)
+    if profile is not None: print_profile(profile)
 
 #computer_max_sim: This simulates games of the max mode guesser.
-    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games
-    #returns: none
-def computer_max_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True):
+    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games; engine - optional output of build_engine for the dictionary, passed on to each game (if not given, one without the feedback matrix is built); workers - number of processes to play the games on (None plays them one after another); seed - makes each keyword's games reproducible (see play_keywords); cache_size - if given, the max/half/sacrifice guesses get remembered in a decision cache of this size shared by every game, and its stats are printed at the end; plot - set to False to skip all the plotting and printing and just get the per-game records back; output - optional .jsonl, .csv or .parquet file to stream the per-game records to as they're played; profile - optional profile (see make_profile) that gets filled in with where the time went. It's printed at the end, and saved next to output as <output>.profile.json
+    #returns: none, or with plot = False, the list of per-game records (see keyword_records), or None if they went to output
+def computer_max_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, workers = None, seed = None, cache_size = None, plot = True, output = None, profile = None):
+    previous = use_profile(profile) #no-op unless a profile was given
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #cheap without the feedback matrix, and means every game can use candidate sets
     if word == "RANDOM":
         word = random.sample(dictionary, n)
     else: 
         n = len(word)
-    guess_sim = [0]*n #number of guesses for each word in the list
-    for i in range(0, n):
-        print(i+1, end = " ")
-        guess_sim[i] = play_game_computer_max(word_length, word[i], dictionary, doprint)
+    cache = None if cache_size is None else make_decision_cache(cache_size) #one cache shared by every game in this run
+    records = None if plot and output is None else open_records(output) #where the per-game records go, if anywhere
+    guess_sim = [game[0] for game in play_keywords([["max", None]], word_length, word, dictionary, doprint, engine, workers, seed, cache, records, progress = plot)] #number of guesses for each word in the list
+    if records is not None: records = close_records(records)
+    use_profile(previous)
+    if profile is not None and isinstance(output, str): save_profile(profile, output + ".profile.json")
+    if not plot:
+        return records
+    plt = load_pyplot()
     plt.hist(guess_sim, bins = np.arange(0, max(guess_sim) + 2, 1))
     plt.title("Maximum Guesser, n = %d" % n)
     plt.xlabel("# of Guesses")
@@ -324,21 +1379,31 @@ def computer_max_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", do
     plt.show()
     print("Average:", mean(guess_sim))
     print("Success %:", (sum(1 for n in guess_sim if n <= 6)/n) * 100)
+    if cache is not None: print_cache_stats(cache)
+    if profile is not None: print_profile(profile)
 
 #computer_half_sim: This simulates games of the half mode guesser.
-    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games
-    #returns: none
-def computer_half_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True):
+    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games; engine - optional output of build_engine for the dictionary, passed on to each game (if not given, one without the feedback matrix is built); workers - number of processes to play the games on (None plays them one after another); seed - makes each keyword's games reproducible (see play_keywords); cache_size - if given, the max/half/sacrifice guesses get remembered in a decision cache of this size shared by every game, and its stats are printed at the end; plot - set to False to skip all the plotting and printing and just get the per-game records back; output - optional .jsonl, .csv or .parquet file to stream the per-game records to as they're played; profile - optional profile (see make_profile) that gets filled in with where the time went. It's printed at the end, and saved next to output as <output>.profile.json
+    #returns: none, or with plot = False, the list of per-game records (see keyword_records), or None if they went to output
+def computer_half_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, workers = None, seed = None, cache_size = None, plot = True, output = None, profile = None):
+    previous = use_profile(profile) #no-op unless a profile was given
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #cheap without the feedback matrix, and means every game can use candidate sets
     if word == "RANDOM":
         word = random.sample(dictionary, n)
     else: 
         n = len(word)
-    guess_sim = [0]*n #number of guesses for each word in the list
-    for i in range(0, n):
-        print(i+1, end = " ")
-        guess_sim[i] = play_game_computer_half(word_length, word[i], dictionary, doprint)
+    cache = None if cache_size is None else make_decision_cache(cache_size) #one cache shared by every game in this run
+    records = None if plot and output is None else open_records(output) #where the per-game records go, if anywhere
+    guess_sim = [game[0] for game in play_keywords([["half", None]], word_length, word, dictionary, doprint, engine, workers, seed, cache, records, progress = plot)] #number of guesses for each word in the list
+    if records is not None: records = close_records(records)
+    use_profile(previous)
+    if profile is not None and isinstance(output, str): save_profile(profile, output + ".profile.json")
+    if not plot:
+        return records
+    plt = load_pyplot()
     plt.hist(guess_sim, bins = np.arange(0, max(guess_sim) + 2, 1))
     plt.title("Half Guesser Guesser, n = %d" % n)
     plt.xlabel("# of Guesses")
@@ -346,24 +1411,33 @@ def computer_half_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", d
     plt.show()
     print("Average:", mean(guess_sim))
     print("Success %:", (sum(1 for n in guess_sim if n <= 6)/n) * 100)
+    if cache is not None: print_cache_stats(cache)
+    if profile is not None: print_profile(profile)
 
 #computer_sacrifice_sim: This simulates games of the sacrifice mode guesser for a particular, given threshold.
-    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; threshold (only uses one single threshold); word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games
-    #returns: none
-def computer_sacrifice_sim(n, word_length, threshold, word = "RANDOM", dictionary = "DEFAULT", doprint = True):
+    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; threshold (only uses one single threshold); word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games; engine - optional output of build_engine for the dictionary, passed on to each game (if not given, one without the feedback matrix is built); workers - number of processes to play the games on (None plays them one after another); seed - makes each keyword's games reproducible (see play_keywords); cache_size - if given, the max/half/sacrifice guesses get remembered in a decision cache of this size shared by every game, and its stats are printed at the end; plot - set to False to skip all the plotting and printing and just get the per-game records back; output - optional .jsonl, .csv or .parquet file to stream the per-game records to as they're played; profile - optional profile (see make_profile) that gets filled in with where the time went. It's printed at the end, and saved next to output as <output>.profile.json
+    #returns: none, or with plot = False, the list of per-game records (see keyword_records), or None if they went to output
+def computer_sacrifice_sim(n, word_length, threshold, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, workers = None, seed = None, cache_size = None, plot = True, output = None, profile = None):
+    previous = use_profile(profile) #no-op unless a profile was given
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #cheap without the feedback matrix, and means every game can use candidate sets
     if word == "RANDOM":
         word = random.sample(dictionary, n)
     else: 
         n = len(word)
-    guess_sim = [0]*n #number of guesses for each word in the list
-    sacrifice_sim = [0]*n #number of sacrifice guesses for each word in the list
-    for i in range(0, n):
-        print(i+1, end = " ")
-        game = play_game_computer_sacrifice(word_length, threshold, word[i], dictionary, doprint)
-        guess_sim[i] = game[0] #gets guesses
-        sacrifice_sim[i] = game[1] #gets sacrifices
+    cache = None if cache_size is None else make_decision_cache(cache_size) #one cache shared by every game in this run
+    records = None if plot and output is None else open_records(output) #where the per-game records go, if anywhere
+    games = play_keywords([["sacrifice", threshold]], word_length, word, dictionary, doprint, engine, workers, seed, cache, records, progress = plot)
+    guess_sim = [game[0][0] for game in games] #number of guesses for each word in the list
+    sacrifice_sim = [game[0][1] for game in games] #number of sacrifice guesses for each word in the list
+    if records is not None: records = close_records(records)
+    use_profile(previous)
+    if profile is not None and isinstance(output, str): save_profile(profile, output + ".profile.json")
+    if not plot:
+        return records
+    plt = load_pyplot()
     plt.hist(guess_sim, bins = np.arange(0, max(guess_sim) + 2, 1))
     plt.title("Sacrifice Guesser, n = {n}, t = {t}".format(n = n, t = threshold))
     plt.xlabel("# of Guesses")
@@ -377,19 +1451,289 @@ def computer_sacrifice_sim(n, word_length, threshold, word = "RANDOM", dictionar
     print("Average:", mean(guess_sim))
     print("Sacrifices:", mean(sacrifice_sim))
     print("Success %:", (sum(1 for n in guess_sim if n <= 6)/n) * 100)
+    if cache is not None: print_cache_stats(cache)
+    if profile is not None: print_profile(profile)
     
+#computer_entropy_sim: This simulates games of the entropy mode guesser.
+    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games; engine - optional output of build_engine for the dictionary, passed on to each game (if not given, one without the feedback matrix is built); workers - number of processes to play the games on (None plays them one after another); seed - makes each keyword's games reproducible (see play_keywords); cache_size - if given, the guesses get remembered in a decision cache of this size shared by every game, and its stats are printed at the end; plot - set to False to skip all the plotting and printing and just get the per-game records back; output - optional .jsonl, .csv or .parquet file to stream the per-game records to as they're played; profile - optional profile (see make_profile) that gets filled in with where the time went. It's printed at the end, and saved next to output as <output>.profile.json
+    #returns: none, or with plot = False, the list of per-game records (see keyword_records), or None if they went to output
+def computer_entropy_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, workers = None, seed = None, cache_size = None, plot = True, output = None, profile = None):
+    previous = use_profile(profile) #no-op unless a profile was given
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    if word == "RANDOM":
+        word = random.sample(dictionary, n)
+    else: 
+        n = len(word)
+    cache = None if cache_size is None else make_decision_cache(cache_size) #one cache shared by every game in this run
+    guess_entropy(candidate_set(engine), word_length, candidate_set(engine)) #works out the opening guess up front, so that parallel workers all start with it
+    records = None if plot and output is None else open_records(output) #where the per-game records go, if anywhere
+    guess_sim = [game[0] for game in play_keywords([["entropy", None]], word_length, word, dictionary, doprint, engine, workers, seed, cache, records, progress = plot)] #number of guesses for each word in the list
+    if records is not None: records = close_records(records)
+    use_profile(previous)
+    if profile is not None and isinstance(output, str): save_profile(profile, output + ".profile.json")
+    if not plot:
+        return records
+    plt = load_pyplot()
+    plt.hist(guess_sim, bins = np.arange(0, max(guess_sim) + 2, 1))
+    plt.title("Entropy Guesser, n = %d" % n)
+    plt.xlabel("# of Guesses")
+    plt.ylabel("Frequency")
+    plt.show()
+    print("Average:", mean(guess_sim))
+    print("Success %:", (sum(1 for n in guess_sim if n <= 6)/n) * 100)
+    if cache is not None: print_cache_stats(cache)
+    if profile is not None: print_profile(profile)
+
+#computer_minimax_sim: This simulates games of the minimax mode guesser.
+    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; word_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; doprint - whether you want results printed out from each of the individual games; engine - optional output of build_engine for the dictionary, passed on to each game (if not given, one without the feedback matrix is built); workers - number of processes to play the games on (None plays them one after another); seed - makes each keyword's games reproducible (see play_keywords); cache_size - if given, the guesses get remembered in a decision cache of this size shared by every game, and its stats are printed at the end; plot - set to False to skip all the plotting and printing and just get the per-game records back; output - optional .jsonl, .csv or .parquet file to stream the per-game records to as they're played; profile - optional profile (see make_profile) that gets filled in with where the time went. It's printed at the end, and saved next to output as <output>.profile.json
+    #returns: none, or with plot = False, the list of per-game records (see keyword_records), or None if they went to output
+def computer_minimax_sim(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, workers = None, seed = None, cache_size = None, plot = True, output = None, profile = None):
+    previous = use_profile(profile) #no-op unless a profile was given
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    if word == "RANDOM":
+        word = random.sample(dictionary, n)
+    else: 
+        n = len(word)
+    cache = None if cache_size is None else make_decision_cache(cache_size) #one cache shared by every game in this run
+    guess_minimax(candidate_set(engine), word_length, candidate_set(engine)) #works out the opening guess up front, so that parallel workers all start with it
+    records = None if plot and output is None else open_records(output) #where the per-game records go, if anywhere
+    guess_sim = [game[0] for game in play_keywords([["minimax", None]], word_length, word, dictionary, doprint, engine, workers, seed, cache, records, progress = plot)] #number of guesses for each word in the list
+    if records is not None: records = close_records(records)
+    use_profile(previous)
+    if profile is not None and isinstance(output, str): save_profile(profile, output + ".profile.json")
+    if not plot:
+        return records
+    plt = load_pyplot()
+    plt.hist(guess_sim, bins = np.arange(0, max(guess_sim) + 2, 1))
+    plt.title("Minimax Guesser, n = %d" % n)
+    plt.xlabel("# of Guesses")
+    plt.ylabel("Frequency")
+    plt.show()
+    print("Average:", mean(guess_sim))
+    print("Success %:", (sum(1 for n in guess_sim if n <= 6)/n) * 100)
+    if cache is not None: print_cache_stats(cache)
+    if profile is not None: print_profile(profile)
+
+#####Multi-board games#####
+#Quordle/Octordle style games - every guess gets scored against several keywords at once, each board has its own candidate set, and the game's over when every board is solved. The strategies are the same ones as for a single board, just spread across boards. entropy and minimax score every guessword against all the boards in one go (adding up how much each guess would tell you about each board), and max, half and rand work on whichever unsolved board has the fewest words left. Any board that's down to one word always gets guessed first, since that's a free solve.
+
+#multi_feedback_scores: The multi-board version of feedback_scores. Every board's candidates get lumped into one array of keywords, each guessword in the pool gets compared against all of them at once, and the histograms are kept separate for each board by offsetting each board's codes into its own range.
+    #parameters: boards - list of CandidateSets (on the same engine), one for each unsolved board; guess_pool - CandidateSet of guesswords to score
+    #returns: a list of two arrays - the sum over boards of count * log2(count) / (board size) (smaller means more information in total), and the sum over boards of the biggest group
+def multi_feedback_scores(boards, guess_pool):
+    engine = guess_pool.engine
+    word_length = engine["word_length"]
+    patterns = 3**word_length
+    sizes = np.array([len(board) for board in boards])
+    answers, spread = np.unique(np.concatenate([board.indices for board in boards]), return_inverse = True) #boards often have the same words left (e.g. when they got the same feedback), so each word only gets compared once and then copied out to every board it's on
+    guesses = guess_pool.indices
+    information = np.zeros(len(guesses))
+    worst = np.zeros(len(guesses), dtype = np.int64)
+    width = len(boards) * patterns
+    block = max(1, block_size() // max(len(spread), width))
+    key_type = np.int32 if block * width < 2**31 else np.int64 #32 bits is plenty for one block's histograms unless MEMORY_BUDGET is enormous
+    offsets = (np.repeat(np.arange(len(boards), dtype = key_type), sizes) * patterns)[None, :] #which board each keyword belongs to
+    for start in range(0, len(guesses), block):
+        guess_block = guesses[start:start + block]
+        if engine["matrix"] is not None:
+            codes = engine["matrix"][guess_block[:, None], answers]
+        else:
+            codes = feedback_codes(engine["codes"][guess_block], engine["codes"][answers], word_length)
+        codes = codes[:, spread]
+        keys = offsets + (np.arange(len(guess_block), dtype = key_type) * width)[:, None]
+        keys += codes
+        counts = np.bincount(keys.ravel(), minlength = len(guess_block) * width).reshape(len(guess_block), len(boards), patterns)
+        information[start:start + block] = ((counts * np.log2(np.maximum(counts, 1))).sum(axis = 2) / sizes).sum(axis = 1)
+        worst[start:start + block] = counts.max(axis = 2).sum(axis = 1)
+    return [information, worst]
+
+#multi_choose: Picks the next guess for a multi-board game.
+    #parameters: boards - list of CandidateSets for the unsolved boards; strategy - "entropy", "minimax", "max", "half" or "rand"; word_length; cache - optional decision cache; rng - where rand mode gets its random numbers from (the random module, or a random.Random)
+    #returns: the guessword
+def multi_choose(boards, strategy, word_length, cache = None, rng = random):
+    for board in boards:
+        if len(board) == 1:
+            return board[0]
+    engine = boards[0].engine
+    if strategy in ["entropy", "minimax"]:
+        guesser = guess_entropy if strategy == "entropy" else guess_minimax
+        if len(boards) == 1 or all(board.indices is engine["all"] for board in boards): #every board looks the same (e.g. the first guess), so it's just the single board guess
+            return choose_guess(cache, guesser, boards[0], word_length, guess_pool = candidate_set(engine))
+        guess_pool = candidate_set(engine)
+        scores = multi_feedback_scores(boards, guess_pool)
+        not_candidate = ~np.isin(guess_pool.indices, np.concatenate([board.indices for board in boards]))
+        order = np.arange(len(guess_pool))
+        information = np.round(scores[0], 9)
+        if strategy == "entropy":
+            return guess_pool[int(np.lexsort((order, not_candidate, information))[0])]
+        return guess_pool[int(np.lexsort((order, information, not_candidate, scores[1]))[0])]
+    board = min(boards, key = len) #the first of the smallest boards
+    if strategy == "rand":
+        return rng.choice(board)
+    return choose_guess(cache, guess_max if strategy == "max" else guess_half, board, word_length)
+
+#trim_boards: Trims every board after a guess in one pass - the guessword gets compared against all the boards' candidates at once, and each board keeps the ones that match its own feedback.
+    #parameters: boards - list of CandidateSets; guessword; compares - the feedback for each board
+    #returns: the list of trimmed CandidateSets
+def trim_boards(boards, guessword, compares):
+    engine = boards[0].engine
+    sizes = [len(board) for board in boards]
+    everything = CandidateSet(engine, np.concatenate([board.indices for board in boards]))
+    keep = candidate_codes(everything, guessword) == np.repeat([encode_compare(compare) for compare in compares], sizes)
+    ends = np.cumsum(sizes)
+    return [CandidateSet(engine, everything.indices[end - size:end][keep[end - size:end]]) for size, end in zip(sizes, ends)]
+
+#play_game_computer_multi: This is computer vs computer on several boards at once (Quordle is 4, Octordle is 8).
+    #parameters: word_length; boards - number of boards; strategy - "entropy", "minimax", "max", "half" or "rand" (see multi_choose); word - list of keywords, one for each board, or "RANDOM" to pick them (all different) from the dictionary; dictionary - defaults to the scrabble list that I downloaded from mathspp; doprint - whether to print stuff; engine - optional output of build_engine for the dictionary (one without the feedback matrix is built if not given); cache - optional decision cache; rng - where the random keywords and rand mode guesses come from (the random module, or a random.Random)
+    #returns: a list of the total number of guesses and a list of which guess solved each board
+def play_game_computer_multi(word_length, boards = 4, strategy = "entropy", word = "RANDOM", dictionary = "DEFAULT", doprint = True, engine = None, cache = None, rng = random):
+    if doprint: print("Playing computer vs computer game on", boards if word == "RANDOM" else len(word), "boards,", strategy, "mode!")
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    full = candidate_set(engine, dictionary)
+    keywords = rng.sample(list(full), boards) if word == "RANDOM" else list(word)
+    for keyword in keywords:
+        if keyword not in engine["index"]:
+            raise ValueError("%s isn't in the dictionary" % keyword)
+    candidates = [full.copy() for keyword in keywords]
+    solved = [None] * len(keywords)
+    guess = 0
+    while None in solved:
+        unsolved = [i for i in range(0, len(keywords)) if solved[i] is None]
+        guessword = multi_choose([candidates[i] for i in unsolved], strategy, word_length, cache, rng)
+        guess += 1
+        compares = [compare_words(keywords[i], guessword, word_length, engine) for i in unsolved]
+        for i, compare in zip(unsolved, compares):
+            if compare == [2]*word_length:
+                solved[i] = guess
+        for i, board in zip(unsolved, trim_boards([candidates[i] for i in unsolved], guessword, compares)):
+            candidates[i] = board
+        if doprint: print("Guessword is", guessword, "-", " ".join(str(len(candidates[i])) if solved[i] is None else "solved" for i in range(0, len(keywords))))
+    if doprint: print("It took the computer", guess, "guesses to solve all", len(keywords), "boards.")
+    return [guess, solved]
+
+#computer_multi_sim: This simulates multi-board games. A game counts as a success if every board is solved within boards + 5 guesses (9 for Quordle, 13 for Octordle).
+    #parameters: n - number of games to be run; word_length; boards - number of boards; strategy - see multi_choose; dictionary; doprint - whether to print each game; engine - optional output of build_engine for the dictionary; seed - optional seed for picking the keywords and the rand mode guesses; cache_size - optional decision cache size; plot - set to False to skip the plotting and printing and just get the results back
+    #returns: none, or with plot = False, the list of play_game_computer_multi results
+def computer_multi_sim(n, word_length, boards = 4, strategy = "entropy", dictionary = "DEFAULT", doprint = False, engine = None, seed = None, cache_size = None, plot = True):
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    rng = random if seed is None else random.Random(seed)
+    cache = None if cache_size is None else make_decision_cache(cache_size)
+    games = list()
+    for i in range(0, n):
+        if plot: print(i+1, end = " ")
+        games.append(play_game_computer_multi(word_length, boards, strategy, rng.sample(dictionary, boards), dictionary, doprint, engine, cache, rng))
+    if not plot:
+        return games
+    guess_sim = [game[0] for game in games]
+    plt = load_pyplot()
+    plt.hist(guess_sim, bins = np.arange(0, max(guess_sim) + 2, 1))
+    plt.title("%d Board %s Guesser, n = %d" % (boards, strategy.capitalize(), n))
+    plt.xlabel("# of Guesses")
+    plt.ylabel("Frequency")
+    plt.show()
+    print("")
+    print("Average:", mean(guess_sim))
+    print("Average guess each board got solved on:", mean([turn for game in games for turn in game[1]]))
+    print("Success %:", (sum(1 for n in guess_sim if n <= boards + 5)/n) * 100)
+    if cache is not None: print_cache_stats(cache)
+
+#####Exact evaluation over a whole dictionary#####
+
+#computer_exact: Works out exactly how a deterministic guesser does on every single keyword in the dictionary, without playing every game separately. Every game starts from the same dictionary, so they all make the same first guess; the comparison output then splits the keywords into groups that all see the same thing and so all make the same next guess, and so on. So this just walks that tree of decisions once, splitting up the keywords at each step, and each guess only gets worked out once for the whole group. Results are identical to playing each keyword with the matching play_game_computer function.
+    #parameters: word_length; method - "max", "half", "sacrifice", "entropy" or "minimax" (random mode isn't deterministic, so it can't be done this way); threshold - only for sacrifice mode; dictionary - uses the Scrabble dictionary by default, and every word in it gets used as a keyword; engine - optional output of build_engine for the dictionary (one without the feedback matrix is built if not given); verbose - whether to print and plot the results
+    #returns: a list containing, in order - a dict of number of guesses -> number of keywords, the average number of guesses, the success %, a dict of number of sacrifice guesses -> number of keywords (only for sacrifice mode, otherwise None), and a dict of keyword -> [guesses, sacrifice guesses]
+def computer_exact(word_length, method = "max", threshold = None, dictionary = "DEFAULT", engine = None, verbose = True):
+    if method not in ["max", "half", "sacrifice", "entropy", "minimax"]:
+        raise ValueError("Exact evaluation only works for the deterministic methods, not %s" % method)
+    if method == "sacrifice":
+        check_threshold(threshold, word_length)
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = verbose)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    full_dictionary = candidate_set(engine, dictionary)
+    guessers = {"max": guess_max, "half": guess_half, "entropy": guess_entropy, "minimax": guess_minimax}
+    cache = make_decision_cache() #sacrifice guesses only depend on the letters used, so lots of branches share them
+    solved = 3**word_length - 1 #encoded [2, 2, 2, 2, 2]
+    keyword_results = dict()
+    #Each branch of the tree is [indices of the keywords in it, guesses so far, letters used, max_compare, sacrifice guesses so far, previous sacrifice guessword], the same state play_game_computer_sacrifice keeps
+    branches = [[full_dictionary.indices, 0, list(), 0, -1, ""]]
+    while len(branches) > 0:
+        [indices, guess, letters_used, max_compare, sacrifice_guess, prev_guessword] = branches.pop()
+        dictionary = CandidateSet(engine, indices)
+        is_sacrifice = False
+        if method == "sacrifice":
+            [guessword, is_sacrifice] = sacrifice_choose(dictionary, full_dictionary, letters_used, max_compare, prev_guessword, threshold, word_length, cache)
+        elif method in ["entropy", "minimax"]:
+            guessword = guessers[method](dictionary, word_length, full_dictionary)
+        else:
+            guessword = guessers[method](dictionary, word_length)
+        codes = candidate_codes(dictionary, guessword)
+        order = np.argsort(codes, kind = "stable") #stable, so each group stays in dictionary order just like trim_dict leaves it
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(codes[order])) + 1, [len(order)]))
+        for j in range(0, len(starts) - 1):
+            group = indices[order[starts[j]:starts[j + 1]]]
+            code = int(codes[order[starts[j]]])
+            if is_sacrifice:
+                [next_letters, next_max, next_sacrifice, next_prev] = [letters_used + list(guessword), max_compare + sum(1 for n in decode_compare(code, word_length) if n != 0), sacrifice_guess + 1, guessword]
+            else:
+                [next_letters, next_max, next_sacrifice, next_prev] = [letters_used, max_compare, sacrifice_guess, prev_guessword]
+            if code == solved:
+                for i in group:
+                    keyword_results[engine["words"][i]] = [guess + 1, next_sacrifice if method == "sacrifice" else None]
+            else:
+                branches.append([group, guess + 1, next_letters, next_max, next_sacrifice, next_prev])
+    guess_counts = dict()
+    sacrifice_counts = dict()
+    for result in keyword_results.values():
+        guess_counts[result[0]] = guess_counts.get(result[0], 0) + 1
+        if method == "sacrifice":
+            sacrifice_counts[result[1]] = sacrifice_counts.get(result[1], 0) + 1
+    n = sum(guess_counts.values())
+    average = sum(k * v for k, v in guess_counts.items())/n
+    success = sum(v for k, v in guess_counts.items() if k <= 6)/n * 100
+    if method != "sacrifice":
+        sacrifice_counts = None
+    if verbose:
+        plt = load_pyplot()
+        plt.bar(list(guess_counts.keys()), list(guess_counts.values()))
+        plt.title("Exact evaluation, %s guesser, n = %d" % (method, n))
+        plt.xlabel("# of Guesses")
+        plt.ylabel("Frequency")
+        plt.show()
+        print("Average:", average)
+        if sacrifice_counts is not None: print("Sacrifices:", sum(k * v for k, v in sacrifice_counts.items())/n)
+        print("Success %:", success)
+    return [dict(sorted(guess_counts.items())), average, success, None if sacrifice_counts is None else dict(sorted(sacrifice_counts.items())), keyword_results]
+
 #####Functions that allow you to compare multiple modes for benchmarking#####
 
-#computer_benchmark: Benchmarks all methods (random, max, half, sacrifice with thresholds up to and including the word length) for a single word length and a single dictionary. Includes some basic text and plotting for visualization. Note that the same keyword list is always used for each method.
-    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; wod_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; dictionary - uses the Scrabble dictionary by default as in previous functions; doprint - whether the individual games should print (set to False because it gets obnoxious quickly); verbose - whether to print text and graphing output from THIS function
-    #returns: a list of lists containing, in order - a list of the names of all the methods used, mean guesses for each method, mean success rate for each method, and number of sacrifice guesses used for the sacrifice methods
-def computer_benchmark(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = False, verbose = True):
+#computer_benchmark: Benchmarks all methods (random, max, half, sacrifice with thresholds up to and including the word length, plus the entropy and minimax baselines) for a single word length and a single dictionary. Includes some basic text and plotting for visualization. Note that the same keyword list is always used for each method.
+    #parameters: n - number of simulations to be run. If a custom word list is provided, n is calculated as the length of that wordlist and the user input is ignored; wod_length; word - If default, then it randomly selects n words from the dictionary, but it can also be a list provided by the user; dictionary - uses the Scrabble dictionary by default as in previous functions; doprint - whether the individual games should print (set to False because it gets obnoxious quickly); verbose - whether to print text and graphing output from THIS function; engine - optional output of build_engine for the dictionary, passed on to each game (if not given, one without the feedback matrix is built); workers - number of processes to play the games on (None plays them one after another); seed - makes each keyword's games reproducible (see play_keywords); cache_size - if given, the max/half/sacrifice guesses get remembered in a decision cache of this size shared by every game, and its stats are printed at the end; plot - set to False to skip all the printing and plotting and just get the per-game records back; output - optional .jsonl, .csv or .parquet file (or an open record stream) to stream the per-game records to as they're played; library - dictionary name to put in the records; profile - optional profile (see make_profile) that gets filled in with where the time went. It's printed at the end, and saved next to output as <output>.profile.json
+    #returns: a list of lists containing, in order - a list of the names of all the methods used, mean guesses for each method, mean success rate for each method, and number of sacrifice guesses used for the sacrifice methods. With plot = False, the list of per-game records instead (see keyword_records), or None if they went to output
+def computer_benchmark(n, word_length, word = "RANDOM", dictionary = "DEFAULT", doprint = False, verbose = True, engine = None, workers = None, seed = None, cache_size = None, plot = True, output = None, library = None, profile = None):
+    previous = use_profile(profile) #no-op unless a profile was given
     if dictionary == "DEFAULT":
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False) #cheap without the feedback matrix, and means every game can use candidate sets
     if word == "RANDOM":
         word = random.sample(dictionary, n)
     else: 
         n = len(word)
+    cache = None if cache_size is None else make_decision_cache(cache_size) #one cache shared by every game in this run
     #Initialize the number of guesses for each method; I'm sure I could combine these into one but for now I value my sanity
     random_guess = [0]*n
     half_guess = [0]*n
@@ -397,37 +1741,55 @@ def computer_benchmark(n, word_length, word = "RANDOM", dictionary = "DEFAULT",
     sacrifice_guess = [[0 for count in range(n)] for count in range(word_length)] #This one has to be a list of lists to account for the different thresholds
     sacrifice_sacrifices = [[0 for count in range(n)] for count in range(word_length)] #Great variable name
     sacrifice_names = [0]*word_length #need these later for plotting, so dumb
+    entropy_guess = [0]*n
+    minimax_guess = [0]*n
+    guess_entropy(candidate_set(engine), word_length, candidate_set(engine)) #works out the opening guesses up front, so that parallel workers all start with them
+    records = output if isinstance(output, dict) else (None if plot and output is None else open_records(output)) #output can also be a record stream that's already open (see computer_benchmark_dictionaries)
+    games = play_keywords(benchmark_jobs(word_length), word_length, word, dictionary, doprint, engine, workers, seed, cache, records, library, progress = plot) #every game in the same order as always, random, half, max and then each sacrifice threshold, with the entropy and minimax baselines last
+    if records is not None and records is not output: records = close_records(records)
+    use_profile(previous)
+    if profile is not None and isinstance(output, str): save_profile(profile, output + ".profile.json")
+    if not plot:
+        return records
     for i in range(0, n):
-        print(i+1, end = " ")
-        random_guess[i] = play_game_computer_rand(word_length, word[i], list(dictionary), doprint) #I have these list conversions here because previously, the play_game_computer functions didn't do it. But I'm still keeping them here because python scares me
-        half_guess[i] = play_game_computer_half(word_length, word[i], list(dictionary), doprint)
-        max_guess[i] = play_game_computer_max(word_length, word[i], list(dictionary), doprint)
+        random_guess[i] = games[i][0]
+        half_guess[i] = games[i][1]
+        max_guess[i] = games[i][2]
         for j in range(0, word_length):
-            temp_game = play_game_computer_sacrifice(word_length, j + 1, word[i], list(dictionary), doprint)
+            temp_game = games[i][3 + j]
             sacrifice_guess[j][i] = temp_game[0]
             sacrifice_sacrifices[j][i] = temp_game[1]
             sacrifice_names[j] = "Sacrifice T" + str(j + 1) #need these later
+        entropy_guess[i] = games[i][3 + word_length]
+        minimax_guess[i] = games[i][4 + word_length]
     random_success = sum(1 for n in random_guess if n <= 6)/n
     half_success = sum(1 for n in half_guess if n <= 6)/n
     max_success = sum(1 for n in max_guess if n <= 6)/n
     sacrifice_success = [0]*word_length
     for i in range(0, word_length):
        sacrifice_success[i] = sum(1 for n in sacrifice_guess[i] if n <= 6)/n
+    entropy_success = sum(1 for n in entropy_guess if n <= 6)/n
+    minimax_success = sum(1 for n in minimax_guess if n <= 6)/n
     if verbose:
+        plt = load_pyplot()
         print("")
         print("Random guess has average score", mean(random_guess), "with success %", random_success * 100)
         print("Max guess has average score", mean(max_guess), "with success %", max_success * 100)
         print("Half guess has average score", mean(half_guess), "with success %", half_success * 100)
         for i in range(0, word_length):
             print("Sacrifice guess with threshold", i + 1, "has average score", mean(sacrifice_guess[i]), "with average sacrifices" , mean(sacrifice_sacrifices[i]), "with success %", sacrifice_success[i] * 100)
+        print("Entropy guess has average score", mean(entropy_guess), "with success %", entropy_success * 100)
+        print("Minimax guess has average score", mean(minimax_guess), "with success %", minimax_success * 100)
+        if cache is not None: print_cache_stats(cache)
+        if profile is not None: print_profile(profile)
         #Scatterplot of mean guess vs methods
-        plt.scatter(["Random", "Max guess", "Half guess"] + sacrifice_names, [mean(random_guess)] + [mean(max_guess)] + [mean(half_guess)] + [mean(x) for x in sacrifice_guess])
+        plt.scatter(["Random", "Max guess", "Half guess"] + sacrifice_names + ["Entropy", "Minimax"], [mean(random_guess)] + [mean(max_guess)] + [mean(half_guess)] + [mean(x) for x in sacrifice_guess] + [mean(entropy_guess)] + [mean(minimax_guess)])
         plt.xticks(rotation = 45)
         plt.xlabel("Method")
         plt.ylabel("Number of Average Guesses, n = %d" % n)
         plt.show()
         #Scatterplot of mean success vs methods
-        plt.scatter(["Random", "Max guess", "Half guess"] + sacrifice_names, [random_success * 100] + [max_success * 100] + [half_success * 100] + [x*100 for x in sacrifice_success])
+        plt.scatter(["Random", "Max guess", "Half guess"] + sacrifice_names + ["Entropy", "Minimax"], [random_success * 100] + [max_success * 100] + [half_success * 100] + [x*100 for x in sacrifice_success] + [entropy_success * 100] + [minimax_success * 100])
         plt.xticks(rotation = 45)
         plt.xlabel("Method")
         plt.ylabel("Success, n = %d" % n)
@@ -438,22 +1800,116 @@ def computer_benchmark(n, word_length, word = "RANDOM", dictionary = "DEFAULT",
         plt.xlabel("Threshold for sacrifice guesses")
         plt.ylabel("Number of Sacrifice Guesses, n = %d" % n)
         plt.show()
-    return [["Random", "Max guess", "Half guess"] + sacrifice_names, [mean(random_guess)] + [mean(max_guess)] + [mean(half_guess)] + [mean(x) for x in sacrifice_guess], [random_success * 100] + [max_success * 100] + [half_success * 100] + [x*100 for x in sacrifice_success], [mean(x) for x in sacrifice_sacrifices]]
+    return [["Random", "Max guess", "Half guess"] + sacrifice_names + ["Entropy", "Minimax"], [mean(random_guess)] + [mean(max_guess)] + [mean(half_guess)] + [mean(x) for x in sacrifice_guess] + [mean(entropy_guess)] + [mean(minimax_guess)], [random_success * 100] + [max_success * 100] + [half_success * 100] + [x*100 for x in sacrifice_success] + [entropy_success * 100] + [minimax_success * 100], [mean(x) for x in sacrifice_sacrifices]]
+
+#benchmark_jobs: The list of [method, threshold] jobs that computer_benchmark plays on every keyword, in the order it plays them.
+    #parameters: word_length
+    #returns: the list of jobs
+def benchmark_jobs(word_length):
+    return [["rand", None], ["half", None], ["max", None]] + [["sacrifice", j + 1] for j in range(0, word_length)] + [["entropy", None], ["minimax", None]]
+
+#benchmark_summary: Boils per-game records down into the same list of lists that computer_benchmark returns.
+    #parameters: records - per-game records (see keyword_records) for one dictionary and word length; word - the list of keywords; word_length
+    #returns: the same as computer_benchmark
+def benchmark_summary(records, word, word_length):
+    results = {(record["method"], record["threshold"], record["keyword"]): record for record in records}
+    guesses = lambda method, threshold: [results[(method, threshold, keyword)]["guesses"] for keyword in word]
+    success = lambda method, threshold: sum(1 for n in guesses(method, threshold) if n <= 6)/len(word) * 100
+    sacrifice_jobs = [["sacrifice", j + 1] for j in range(0, word_length)]
+    jobs = [["rand", None], ["max", None], ["half", None]] + sacrifice_jobs + [["entropy", None], ["minimax", None]] #the order computer_benchmark reports them in
+    return [["Random", "Max guess", "Half guess"] + ["Sacrifice T" + str(j + 1) for j in range(0, word_length)] + ["Entropy", "Minimax"], [mean(guesses(job[0], job[1])) for job in jobs], [success(job[0], job[1]) for job in jobs], [mean([results[(job[0], job[1], keyword)]["sacrifices"] for keyword in word]) for job in sacrifice_jobs]]
+
+#open_checkpoint: Opens (or creates) a checkpoint log for the long benchmarks. This is a JSON Lines file holding every finished game's record (see keyword_records), plus the seed and the keyword list picked for each dictionary and word length, so that a run that crashes or gets interrupted can pick up where it left off and still come out exactly the same. It works as a record stream (see open_records) - records get written and flushed as soon as each keyword is done.
+    #parameters: path; seed - seed for the games (see play_keywords). If the log already has one, that's used instead; if neither does, one is picked and saved
+    #returns: the checkpoint (a record stream with the extra bits)
+def open_checkpoint(path, seed = None):
+    stream = {"path": path, "format": "checkpoint", "records": list(), "done": set(), "keywords": dict(), "seed": None, "writer": None}
+    if os.path.exists(path):
+        with open(path, "rb+") as f:
+            offset = 0 #where the last complete line ends
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break #a half-written last line from whatever killed the run
+                offset += len(line)
+                entry = json.loads(line)
+                if entry.get("type") == "seed":
+                    stream["seed"] = entry["seed"]
+                elif entry.get("type") == "keywords":
+                    stream["keywords"][(entry["library"], entry["word_length"])] = entry["keywords"]
+                else:
+                    stream["records"].append(entry)
+                    stream["done"].add((entry["library"], entry["word_length"], entry["method"], entry["threshold"], entry["keyword"]))
+            f.truncate(offset) #chop off any half-written line, or the next record would get stuck onto the end of it
+    stream["file"] = open(path, "a")
+    if stream["seed"] is None:
+        stream["seed"] = seed if seed is not None else random.getrandbits(64)
+        stream["file"].write(json.dumps({"type": "seed", "seed": stream["seed"]}) + "\n")
+        stream["file"].flush()
+    return stream
+
+#checkpoint_benchmark: Does what computer_benchmark does for one dictionary and word length (without the printing and plotting), but through a checkpoint log - keyword/method combinations that are already in the log get skipped, and everything new gets logged as soon as it's played.
+    #parameters: checkpoint - from open_checkpoint; n; word_length; word; dictionary; library - name of the dictionary (None for the word length benchmark); workers; cache_size; profile - optional profile to fill in
+    #returns: the same as computer_benchmark
+def checkpoint_benchmark(checkpoint, n, word_length, word, dictionary, library = None, workers = None, cache_size = None, profile = None):
+    cell = (library, word_length)
+    if cell in checkpoint["keywords"]:
+        word = checkpoint["keywords"][cell]
+    else:
+        word = random.sample(dictionary, n) if word == "RANDOM" else list(word)
+        checkpoint["keywords"][cell] = word
+        checkpoint["file"].write(json.dumps({"type": "keywords", "library": library, "word_length": word_length, "keywords": word}) + "\n")
+        checkpoint["file"].flush()
+    previous = use_profile(profile)
+    missing = dict() #groups keywords by which jobs they still need
+    for keyword in word:
+        jobs = tuple(tuple(job) for job in benchmark_jobs(word_length) if (library, word_length, job[0], job[1], keyword) not in checkpoint["done"])
+        if len(jobs) > 0 and keyword not in missing.get(jobs, []):
+            missing.setdefault(jobs, list()).append(keyword)
+    if len(missing) > 0:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+        cache = None if cache_size is None else make_decision_cache(cache_size)
+        guess_entropy(candidate_set(engine), word_length, candidate_set(engine))
+        for jobs, keywords in missing.items():
+            print("Playing", len(keywords), "keywords (" + str(len(word) - len(keywords)), "already done)")
+            play_keywords([list(job) for job in jobs], word_length, keywords, dictionary, False, engine, workers, checkpoint["seed"], cache, checkpoint, library)
+            print("")
+    else:
+        print("Already done")
+    use_profile(previous)
+    return benchmark_summary([record for record in checkpoint["records"] if record["library"] == library and record["word_length"] == word_length], word, word_length)
 
 #computer_benchmark_dictionaries: This is a multi-benchmarking function that I used to make some of the key visualization figures. This function benchmarks all of the methods for five different dictionaries: the scrabble dictionary, full wordle accepted dictionary, and words taken from top 10,000, 20,000, and 100,000 most common English words (from slightly different sources) - please see the Github for all of the sources. Because some of these dictionaries only contain 5 letter words, this function does not allow you to choose word length - it is hard-coded in as 5.
-    #parameters: n - number of simulations to run; word - If left as "RANDOM" it will default to a random list taken from that specific dictionary, otherwise uses the input user list
-    #returns: none
-def computer_benchmark_dictionaries(n, word = "RANDOM"):
+    #parameters: n - number of simulations to run; word - If left as "RANDOM" it will default to a random list taken from that specific dictionary, otherwise uses the input user list; workers, seed, cache_size - passed on to computer_benchmark; plot - set to False to skip the plots; output - optional .jsonl, .csv or .parquet file to stream every game's record to (tagged with the dictionary name); checkpoint - optional checkpoint log (see open_checkpoint). If the log is from an earlier run that didn't finish, everything already in it is skipped. These runs can take a looooong time, so this is worth using for anything big; profile - optional profile (see make_profile) to fill in. Each dictionary also gets its own entry in profile["cells"] (see add_profile_cell), and the whole thing is saved next to output as <output>.profile.json
+    #returns: a list of the stats and sacrifices dataframes
+def computer_benchmark_dictionaries(n, word = "RANDOM", workers = None, seed = None, cache_size = None, plot = True, output = None, checkpoint = None, profile = None):
+    pd = load_pandas()
     dictionary_names = ["Scrabble dictionary", "Wordle Accepted Words", "10000 Most Common", "20000 Most Common", "100000 Most Common"]
     dictionary_list = [load_words("/home/skannan4/Downloads/WORD.LST", word_length = 5, doprint = False), load_words("/home/skannan4/Downloads/wordle.txt", word_length = 5, doprint = False), load_words("/home/skannan4/Downloads/10000w.txt", word_length = 5, doprint = False), load_words("/home/skannan4/Downloads/20000w.txt", word_length = 5, doprint = False), load_words("/home/skannan4/Downloads/100000w.txt", word_length = 5, doprint = False)]
     stats = pd.DataFrame() #Yeaaaaah let's do some dataframes! The R side of my brain is happy
     sacrifices = pd.DataFrame()
+    records = None if output is None else open_records(output) #one stream for all five dictionaries
+    checkpoint = None if checkpoint is None else open_checkpoint(checkpoint, seed)
     for i in range(0, 5):
         print(dictionary_names[i])
-        benchmark = computer_benchmark(n, word_length = 5, word = word, dictionary = list(dictionary_list[i]), doprint = False, verbose = False) #verbose off cuz no one wants to see all that crap
+        cell_profile = None if profile is None else make_profile()
+        if checkpoint is None:
+            benchmark = computer_benchmark(n, word_length = 5, word = word, dictionary = list(dictionary_list[i]), doprint = False, verbose = False, workers = workers, seed = seed, cache_size = cache_size, output = records, library = dictionary_names[i], profile = cell_profile) #verbose off cuz no one wants to see all that crap
+        else:
+            benchmark = checkpoint_benchmark(checkpoint, n, 5, word, list(dictionary_list[i]), dictionary_names[i], workers, cache_size, cell_profile)
+        if profile is not None: add_profile_cell(profile, cell_profile, dictionary_names[i], 5, len(dictionary_list[i]))
         stats = pd.concat([stats, pd.DataFrame(list(map(list, zip(*[benchmark[0], benchmark[1], benchmark[2], [dictionary_names[i]] * len(benchmark[0])]))), columns = ["Method", "Guesses", "Success", "Library"])]) #The right side of this basically just transposes the lists to get them into tidy format as a dataframe, then appends to main dataframe
-        sacrifices = pd.concat([sacrifices, pd.DataFrame(list(map(list, zip(*[benchmark[0][3:], benchmark[3], [dictionary_names[i]] * len(benchmark[0][3:])]))), columns = ["Method", "Sacrifices", "Library"])])
+        sacrifices = pd.concat([sacrifices, pd.DataFrame(list(map(list, zip(*[benchmark[0][3:3 + len(benchmark[3])], benchmark[3], [dictionary_names[i]] * len(benchmark[3])]))), columns = ["Method", "Sacrifices", "Library"])])
         print("")
+    if checkpoint is not None:
+        if records is not None:
+            for record in checkpoint["records"]: write_record(records, record) #the log has everything, including games from earlier runs
+        close_records(checkpoint)
+    if records is not None: close_records(records)
+    if profile is not None and output is not None: save_profile(profile, output + ".profile.json")
+    if not plot:
+        return [stats, sacrifices]
+    plt = load_pyplot()
+    sns = load_seaborn()
     #Scatterplot of guesses vs method by library used
     sns.catplot(x="Method", y="Guesses", hue="Library", kind = "swarm", data=stats)
     plt.xticks(rotation = 45)
@@ -468,22 +1924,396 @@ def computer_benchmark_dictionaries(n, word = "RANDOM"):
     #Lineplot of number of sacrifices used based on threshold
     sns.catplot(x="Method", y="Sacrifices", hue="Library", kind = "point", data=sacrifices)
     plt.xticks(rotation = 45)
+    if profile is not None: print_profile(profile)
+    return [stats, sacrifices]
     
 #computer_benchmark_wordlength: Benchmarks all of the methods on one dictionary at multiple word lengths (3-8). In theory, I could have probably made this such that the dictionary was choosable, but I got lazy and so the dictionary is hard-coded in as the scrabble dictionary.
-    #parameters: n - number of simulations; word - If left as "RANDOM" it will default to a random list taken from that specific dictionary, otherwise uses the input user list
-    #returns: none
-def computer_benchmark_wordlength(n, word = "RANDOM"):        
+    #parameters: n - number of simulations; word - If left as "RANDOM" it will default to a random list taken from that specific dictionary, otherwise uses the input user list; workers, seed, cache_size - passed on to computer_benchmark; plot - set to False to skip the plots; output - optional .jsonl, .csv or .parquet file to stream every game's record to; checkpoint - optional checkpoint log, same as computer_benchmark_dictionaries; profile - optional profile, same as computer_benchmark_dictionaries but with a cell for each word length
+    #returns: a list of the stats and sacrifices dataframes
+def computer_benchmark_wordlength(n, word = "RANDOM", workers = None, seed = None, cache_size = None, plot = True, output = None, checkpoint = None, profile = None):        
+    pd = load_pandas()
     stats = pd.DataFrame()
     sacrifices = pd.DataFrame()
+    records = None if output is None else open_records(output)
+    checkpoint = None if checkpoint is None else open_checkpoint(checkpoint, seed)
     for i in range(3, 9):
         dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length = i, doprint = False)  
         print("Word Length", i)
-        benchmark = computer_benchmark(n, word_length = i, word = word, dictionary = list(dictionary), doprint = False, verbose = False)
+        cell_profile = None if profile is None else make_profile()
+        if checkpoint is None:
+            benchmark = computer_benchmark(n, word_length = i, word = word, dictionary = list(dictionary), doprint = False, verbose = False, workers = workers, seed = seed, cache_size = cache_size, output = records, profile = cell_profile)
+        else:
+            benchmark = checkpoint_benchmark(checkpoint, n, i, word, list(dictionary), None, workers, cache_size, cell_profile)
+        if profile is not None: add_profile_cell(profile, cell_profile, None, i, len(dictionary))
         stats = pd.concat([stats, pd.DataFrame(list(map(list, zip(*[benchmark[0], benchmark[1], benchmark[2], [i] * len(benchmark[0])]))), columns = ["Method", "Guesses", "Success", "Word Length"])])
-        sacrifices = pd.concat([sacrifices, pd.DataFrame(list(map(list, zip(*[benchmark[0][3:], benchmark[3], [i] * len(benchmark[0][3:])]))), columns = ["Method", "Sacrifices", "Word Length"])])
+        sacrifices = pd.concat([sacrifices, pd.DataFrame(list(map(list, zip(*[benchmark[0][3:3 + len(benchmark[3])], benchmark[3], [i] * len(benchmark[3])]))), columns = ["Method", "Sacrifices", "Word Length"])])
         print("")
+    if checkpoint is not None:
+        if records is not None:
+            for record in checkpoint["records"]: write_record(records, record) #the log has everything, including games from earlier runs
+        close_records(checkpoint)
+    if records is not None: close_records(records)
+    if profile is not None and output is not None: save_profile(profile, output + ".profile.json")
+    if not plot:
+        return [stats, sacrifices]
+    plt = load_pyplot()
+    sns = load_seaborn()
     sns.catplot(x="Word Length", y="Guesses", hue="Method", kind = "point", data=stats)
     plt.show()
     sns.catplot(x="Word Length", y="Success", hue="Method", kind = "point", data=stats)
     plt.show()
-    
\ No newline at end of file
+    if profile is not None: print_profile(profile)
+    return [stats, sacrifices]
+    
+
+#####Adaptive simulations#####
+#The sims and benchmarks play a fixed n games, and there's no good way to know ahead of time how many is enough (the random guesser bounces around a lot more than the others, for one). These play games in batches instead, keeping a running mean and success rate with confidence intervals for each method, and each method stops as soon as its interval is narrow enough (or it runs out of games).
+
+#mean_interval: Normal approximation confidence interval for a mean.
+    #parameters: values; confidence - e.g. 0.95
+    #returns: [mean, low, high]
+def mean_interval(values, confidence = 0.95):
+    center = mean(values)
+    if len(values) < 2:
+        return [center, float("-inf"), float("inf")]
+    half = NormalDist().inv_cdf((1 + confidence) / 2) * stdev(values) / len(values)**0.5
+    return [center, center - half, center + half]
+
+#success_interval: Wilson score confidence interval for a success rate (it behaves itself near 0% and 100%, unlike the normal one).
+    #parameters: successes; n; confidence
+    #returns: [rate, low, high], as percents
+def success_interval(successes, n, confidence = 0.95):
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = successes / n
+    center = (rate + z**2 / (2 * n)) / (1 + z**2 / n)
+    half = z * (rate * (1 - rate) / n + z**2 / (4 * n**2))**0.5 / (1 + z**2 / n)
+    return [100 * rate, 100 * max(0, center - half), 100 * min(1, center + half)]
+
+#computer_adaptive: Plays each method on batches of keywords until it's pinned down well enough. Every method gets the same keywords in the same order (so they can still be compared head to head), and a method stops once the confidence interval for its average number of guesses is no wider than +/- precision (and the one for its success % no wider than +/- success_precision, if given), or once it's played max_games.
+    #parameters: word_length; jobs - list of [method, threshold] pairs like in play_keywords (defaults to everything computer_benchmark plays); dictionary; precision - target half-width of the interval on average guesses; success_precision - optional target half-width of the interval on success %; confidence; batch - games per method per round; min_games - games to play before stopping is even considered, since a few games can look a lot more consistent than they are; max_games - most games per method; engine; workers; seed; cache_size - same as in the sims; output - optional .jsonl, .csv or .parquet file to stream every game's record to; doprint - whether to print each round's progress and the final report
+    #returns: a list with a dict for each job - method, threshold, games played, mean and its interval, success % and its interval, and why it stopped ("precision" or "budget")
+def computer_adaptive(word_length, jobs = None, dictionary = "DEFAULT", precision = 0.05, success_precision = None, confidence = 0.95, batch = 100, min_games = 200, max_games = 10000, engine = None, workers = None, seed = None, cache_size = None, output = None, doprint = True):
+    if dictionary == "DEFAULT":
+        dictionary = load_words("/home/skannan4/Downloads/WORD.LST", word_length, doprint = doprint)
+    if engine is None:
+        engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    if jobs is None:
+        jobs = benchmark_jobs(word_length)
+    rng = random if seed is None else random.Random(seed)
+    keywords = list()
+    while len(keywords) < max_games: #once the whole dictionary's been used, it goes round again in a new order
+        keywords += rng.sample(dictionary, min(len(dictionary), max_games - len(keywords)))
+    cache = None if cache_size is None else make_decision_cache(cache_size)
+    if any(job[0] in ["entropy", "minimax"] for job in jobs):
+        guess_entropy(candidate_set(engine), word_length, candidate_set(engine))
+    records = None if output is None else open_records(output)
+    guesses = [list() for job in jobs]
+    report = [None] * len(jobs)
+    played = 0
+    while played < max_games and any(result is None for result in report):
+        active = [i for i in range(0, len(jobs)) if report[i] is None]
+        word = keywords[played:played + batch]
+        games = list()
+        start = played
+        while start < played + len(word): #each pass over the dictionary gets its own seed, or a keyword's second time round would just replay its first game
+            lap = start // len(dictionary)
+            stop = min(played + len(word), (lap + 1) * len(dictionary))
+            lap_seed = seed if seed is None or lap == 0 else "%s:%d" % (seed, lap)
+            games += play_keywords([jobs[i] for i in active], word_length, keywords[start:stop], dictionary, False, engine, workers, lap_seed, cache, records, progress = False)
+            start = stop
+        for game in games:
+            for j, i in enumerate(active):
+                guesses[i].append(game[j][0] if jobs[i][0] == "sacrifice" else game[j])
+        played += len(word)
+        for i in active:
+            [center, low, high] = mean_interval(guesses[i], confidence)
+            success = success_interval(sum(1 for n in guesses[i] if n <= 6), len(guesses[i]), confidence)
+            precise = played >= min_games and (high - low) / 2 <= precision and (success_precision is None or (success[2] - success[1]) / 2 <= success_precision)
+            if precise or played >= max_games:
+                report[i] = {"method": jobs[i][0], "threshold": jobs[i][1], "games": len(guesses[i]), "mean": center, "mean_low": low, "mean_high": high, "success": success[0], "success_low": success[1], "success_high": success[2], "stopped": "precision" if precise else "budget"}
+        if doprint: print(played, "games played,", sum(1 for result in report if result is None), "methods still going")
+    if records is not None: close_records(records)
+    if doprint:
+        for result in report:
+            print("%-12s %4s: %5d games, average %.3f (%.3f-%.3f), success %% %.1f (%.1f-%.1f), stopped on %s" % (result["method"], "" if result["threshold"] is None else "T%d" % result["threshold"], result["games"], result["mean"], result["mean_low"], result["mean_high"], result["success"], result["success_low"], result["success_high"], result["stopped"]))
+    return report
+
+#####Speed benchmarks for the solver primitives#####
+#The computer_benchmark functions measure how good the guesses are, not how fast anything is. These time the building blocks (compare_words, trim_dict, count_chars and the guessers, both on plain lists and on candidate sets) and whole games, on made-up dictionaries so they run anywhere, offline, and give the same words every time. Results can be saved as a baseline and later runs checked against it. Baselines only mean anything on the machine they were made on.
+
+#Rough English letter frequencies, so that the made-up dictionaries have the same sort of lopsided letter counts the guessers see in real ones
+LETTER_WEIGHTS = [8.2, 1.5, 2.8, 4.3, 12.7, 2.2, 2.0, 6.1, 7.0, 0.15, 0.77, 4.0, 2.4, 6.7, 7.5, 1.9, 0.095, 6.0, 6.3, 9.1, 2.8, 0.98, 2.4, 0.15, 2.0, 0.074]
+
+#synthetic_words: Makes up a dictionary of distinct random words. Short word lengths don't have enough possible words for the big sizes, so you can get fewer words than asked for.
+    #parameters: size - number of words; word_length; seed
+    #returns: the dictionary (a list, like load_words gives)
+def synthetic_words(size, word_length, seed = 0):
+    rng = np.random.default_rng([seed, size, word_length])
+    weights = np.array(LETTER_WEIGHTS) / sum(LETTER_WEIGHTS)
+    words = dict() #a dict rather than a set, to keep the order they came up in
+    while len(words) < size:
+        before = len(words)
+        codes = rng.choice(26, size = (size, word_length), p = weights).astype(np.uint8) + ord("a")
+        for word in codes.view("S%d" % word_length).ravel():
+            words[word.decode("ascii")] = None
+            if len(words) == size:
+                break
+        if len(words) - before < size // 100: #pretty much every likely word has come up already
+            break
+    return list(words)
+
+#time_calls: Calls a function over and over for at least min_time seconds, then once more under tracemalloc to see how much memory it needs at its peak.
+    #parameters: function - takes no arguments (a lambda); min_time - seconds
+    #returns: [calls per second, peak memory in bytes]
+def time_calls(function, min_time = 0.2):
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return [calls / elapsed, peak]
+
+#speed_cases: Lays out everything speed_benchmark times for one dictionary. Each case is [name, path, function], where path says whether it's the plain list version ("list") or the candidate set version ("engine"). The list version of trim_dict gets a fresh copy of the dictionary each call, since it trims in place.
+    #parameters: dictionary; word_length; seed; lists - whether to include the list versions at all (the list trim_dict removes words one at a time, so it takes forever on big dictionaries)
+    #returns: the list of cases
+def speed_cases(dictionary, word_length, seed = 0, lists = True):
+    rng = random.Random("%s:%d:%d" % (seed, len(dictionary), word_length))
+    engine = build_engine(dictionary, word_length, feedback = False, doprint = False)
+    keywords = rng.sample(dictionary, min(len(dictionary), 64))
+    guessword = rng.choice(dictionary)
+    compare = compare_words(keywords[0], guessword, word_length)
+    letters_used = list(guessword)
+    pairs = [[rng.choice(dictionary), rng.choice(dictionary)] for i in range(0, 1000)]
+    games = {"count": 0}
+    def play(method, threshold = None): #cycles through the keywords so that a game isn't always the same one
+        games["count"] += 1
+        return play_game_method(method, word_length, keywords[games["count"] % len(keywords)], dictionary, False, engine, threshold)
+    cases = [["compare_words x1000", "list", lambda: [compare_words(pair[0], pair[1], word_length) for pair in pairs]],
+             ["trim_dict", "list", lambda: trim_dict(list(dictionary), guessword, compare, word_length)],
+             ["trim_dict", "engine", lambda: trim_dict(candidate_set(engine), guessword, compare, word_length)],
+             ["count_chars", "list", lambda: count_chars(dictionary)],
+             ["count_chars", "engine", lambda: count_chars(candidate_set(engine))]]
+    for guesser in [guess_max, guess_half]:
+        cases.append([guesser.__name__, "list", lambda guesser = guesser: guesser(dictionary, word_length)])
+        cases.append([guesser.__name__, "engine", lambda guesser = guesser: guesser(candidate_set(engine), word_length)])
+    cases.append(["guess_sacrifice", "list", lambda: guess_sacrifice(dictionary, letters_used, word_length)])
+    cases.append(["guess_sacrifice", "engine", lambda: guess_sacrifice(candidate_set(engine), letters_used, word_length)])
+    for method in ["rand", "max", "half"]:
+        cases.append(["game " + method, "engine", lambda method = method: play(method)])
+    cases.append(["game sacrifice T2", "engine", lambda: play("sacrifice", 2)])
+    return [case for case in cases if lists or case[1] != "list"]
+
+#speed_benchmark: Times every primitive (see speed_cases) on made-up dictionaries of each size and word length. Throughput is calls per second, so for the games it's games per second and for trim_dict it's trims per second. If a baseline file is given, anything that got slower or hungrier than the baseline by more than the tolerance gets flagged.
+    #parameters: sizes - dictionary sizes; word_lengths; seed - for the made-up dictionaries; min_time - seconds to spend timing each case; list_limit - biggest dictionary to time the list versions on; baseline - optional JSON file of an earlier run to check against; save - optional JSON file to save this run to (e.g. as the new baseline); tolerance - fraction slower (or more memory) that counts as a regression; doprint - whether to print each result as it goes, plus the regressions at the end
+    #returns: a list of [results, regressions]. Each result is a dict with the primitive, path, word_length, words, per_second and peak_bytes; each regression is [result, baseline result]
+def speed_benchmark(sizes = [1000, 10000, 50000, 200000], word_lengths = [3, 4, 5, 6, 7, 8], seed = 0, min_time = 0.2, list_limit = 50000, baseline = None, save = None, tolerance = 0.25, doprint = True):
+    results = list()
+    for word_length in word_lengths:
+        for size in sizes:
+            dictionary = synthetic_words(size, word_length, seed)
+            for name, path, function in speed_cases(dictionary, word_length, seed, len(dictionary) <= list_limit):
+                per_second, peak = time_calls(function, min_time)
+                results.append({"primitive": name, "path": path, "word_length": word_length, "words": len(dictionary), "per_second": per_second, "peak_bytes": peak})
+                if doprint: print("%-20s %-6s length %d, %6d words: %12.1f per second, %10.1f KB peak" % (name, path, word_length, len(dictionary), per_second, peak / 1024))
+    regressions = list()
+    if baseline is not None:
+        with open(baseline) as f:
+            previous = {(result["primitive"], result["path"], result["word_length"], result["words"]): result for result in json.load(f)}
+        for result in results:
+            old = previous.get((result["primitive"], result["path"], result["word_length"], result["words"]))
+            if old is not None and (result["per_second"] < old["per_second"] * (1 - tolerance) or result["peak_bytes"] > old["peak_bytes"] * (1 + tolerance) + 4096): #a few KB of slack, since tiny peaks bounce around
+                regressions.append([result, old])
+        if doprint:
+            print(len(regressions), "regressions against", baseline)
+            for result, old in regressions:
+                print("%-20s %-6s length %d, %6d words: %.1f -> %.1f per second, %.1f -> %.1f KB peak" % (result["primitive"], result["path"], result["word_length"], result["words"], old["per_second"], result["per_second"], old["peak_bytes"] / 1024, result["peak_bytes"] / 1024))
+    if save is not None:
+        with open(save, "w") as f:
+            json.dump(results, f, indent = 1)
+    return [results, regressions]
+
+#####Solver service#####
+#Runs the solvers as a long-lived local server that lots of clients can use at once, so the dictionaries and their engines only get loaded once. It's an asyncio server speaking JSON, one request per line and one reply per line (see serve for the requests). Each game is a session that keeps its own candidate set, letters used and strategy. Picking a guess can take a while (entropy on a big dictionary, say), so guesses and batches get handed to a pool of worker processes. The engines (opening guesses and all) get built once by the service and handed to the workers, each of which keeps its own decision cache, and the event loop just keeps answering everyone else.
+
+#Holds the engines and decision cache inside each service worker process
+_service_state = None
+
+#_init_service_worker: Hands the engines and decision cache to a service worker. Only needed when processes can't be forked - forked workers just inherit _service_state from the service.
+def _init_service_worker(state):
+    global _service_state
+    _service_state = state
+
+#_service_guess: Picks the next guess for a session, in a worker. The candidates come over as their positions in the dictionary (None meaning the whole thing, so the opening guesses can still be remembered).
+    #returns: [guessword, whether it's a sacrifice guess]
+def _service_guess(library, strategy, threshold, indices, letters_used, max_compare, prev_guessword):
+    engine = _service_state["engines"][library]
+    cache = _service_state["cache"]
+    word_length = engine["word_length"]
+    candidates = candidate_set(engine) if indices is None else CandidateSet(engine, indices)
+    if strategy == "sacrifice":
+        return sacrifice_choose(candidates, candidate_set(engine), letters_used, max_compare, prev_guessword, threshold, word_length, cache)
+    if strategy in ["entropy", "minimax"]:
+        return [choose_guess(cache, guess_entropy if strategy == "entropy" else guess_minimax, candidates, word_length, guess_pool = candidate_set(engine)), False]
+    return [choose_guess(cache, guess_max if strategy == "max" else guess_half, candidates, word_length), False]
+
+#_service_batch: Plays a list of keywords in a worker, for the batch request. repeats says how many times each keyword has already come up in the whole batch (see keyword_repeats), so splitting it between workers doesn't change the results.
+def _service_batch(library, jobs, keywords, repeats, seed):
+    engine = _service_state["engines"][library]
+    return [play_keyword_jobs(jobs, engine["word_length"], keyword, engine["words"], False, engine, seed, _service_state["cache"], repeat) for keyword, repeat in zip(keywords, repeats)]
+
+#_service_request: Answers one request (see serve).
+async def _service_request(service, request):
+    op = request.get("op")
+    engines = service["engines"]
+    loop = asyncio.get_running_loop()
+    if op == "libraries":
+        return {"libraries": {name: {"word_length": engine["word_length"], "words": len(engine["words"])} for name, engine in engines.items()}}
+    if op == "new":
+        library = request.get("library", next(iter(engines)))
+        strategy = request.get("strategy", "max")
+        if library not in engines:
+            raise ValueError("Unknown library: %s" % library)
+        if strategy not in ["rand", "max", "half", "sacrifice", "entropy", "minimax"]:
+            raise ValueError("Unknown strategy: %s" % strategy)
+        if strategy == "sacrifice":
+            check_threshold(request.get("threshold", 2), engines[library]["word_length"])
+        service["count"] += 1
+        session = str(service["count"])
+        service["sessions"][session] = {"library": library, "strategy": strategy, "threshold": request.get("threshold", 2), "candidates": candidate_set(engines[library]), "letters_used": list(), "max_compare": 0, "prev_guessword": "", "guesses": 0, "pending": None, "lock": asyncio.Lock()}
+        return {"session": session, "candidates": len(engines[library]["words"])}
+    if op == "batch":
+        library = request.get("library", next(iter(engines)))
+        engine = engines[library]
+        keywords = request["keywords"]
+        for keyword in keywords:
+            if keyword not in engine["index"]:
+                raise ValueError("%s isn't in %s" % (keyword, library))
+        method = request.get("method", "max")
+        if method == "sacrifice":
+            check_threshold(request.get("threshold"), engine["word_length"])
+        jobs = [[method, request.get("threshold")]]
+        chunk_size = max(1, -(-len(keywords) // service["workers"]))
+        repeats = keyword_repeats(keywords)
+        chunks = await asyncio.gather(*[loop.run_in_executor(service["pool"], _service_batch, library, jobs, keywords[start:start + chunk_size], repeats[start:start + chunk_size], request.get("seed")) for start in range(0, len(keywords), chunk_size)])
+        results = [result[0] for chunk in chunks for result in chunk]
+        guesses = [result[0] if method == "sacrifice" else result for result in results]
+        return {"results": results, "average": mean(guesses) if len(guesses) > 0 else None, "success": 100 * sum(1 for n in guesses if n <= 6) / len(guesses) if len(guesses) > 0 else None}
+    session = service["sessions"].get(request.get("session"))
+    if session is None:
+        raise ValueError("Unknown session: %s" % request.get("session"))
+    engine = engines[session["library"]]
+    word_length = engine["word_length"]
+    async with session["lock"]: #one request at a time per session, even from different connections
+        if op == "guess":
+            if len(session["candidates"]) == 0:
+                raise ValueError("No words fit the feedback so far")
+            if session["pending"] is None:
+                if session["strategy"] == "rand":
+                    session["pending"] = [random.choice(session["candidates"]), False]
+                else:
+                    indices = None if session["candidates"].indices is engine["all"] else session["candidates"].indices
+                    session["pending"] = await loop.run_in_executor(service["pool"], _service_guess, session["library"], session["strategy"], session["threshold"], indices, session["letters_used"], session["max_compare"], session["prev_guessword"])
+            return {"guess": session["pending"][0], "sacrifice": session["pending"][1], "candidates": len(session["candidates"])}
+        if op == "feedback":
+            guessword = request.get("guess", None if session["pending"] is None else session["pending"][0])
+            if not isinstance(guessword, str) or len(guessword) != word_length or not all("a" <= letter <= "z" for letter in guessword):
+                raise ValueError("Need a %d letter guess" % word_length)
+            compare = request.get("feedback")
+            compare = parse_feedback(compare, word_length) if isinstance(compare, str) else compare
+            if not isinstance(compare, list) or len(compare) != word_length or any(n not in [0, 1, 2] for n in compare):
+                raise ValueError("Couldn't read the feedback")
+            if session["pending"] is not None and session["pending"][1] and session["pending"][0] == guessword: #the same bookkeeping as play_game_computer_sacrifice does for a sacrifice guess
+                session["letters_used"] = session["letters_used"] + list(guessword)
+                session["max_compare"] += sum(1 for n in compare if n != 0)
+                session["prev_guessword"] = guessword
+            session["pending"] = None
+            session["guesses"] += 1
+            session["candidates"] = trim_dict(session["candidates"], guessword, compare, word_length)
+            return {"candidates": len(session["candidates"]), "words": list(session["candidates"][0:service["show"]]), "solved": compare == [2]*word_length, "guesses": session["guesses"]}
+        if op == "close":
+            del service["sessions"][request["session"]]
+            return {"closed": request["session"]}
+    raise ValueError("Unknown op: %s" % op)
+
+#_service_connection: Handles one client connection, one request line at a time.
+async def _service_connection(service, reader, writer):
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        request = dict()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Requests have to be JSON objects")
+            reply = await _service_request(service, request)
+        except Exception as error: #anything that goes wrong with one request (including a worker process dying) gets reported back, rather than dropping the connection
+            reply = {"error": str(error) or type(error).__name__}
+        if isinstance(request, dict) and "id" in request:
+            reply["id"] = request["id"]
+        writer.write((json.dumps(reply) + "\n").encode("utf-8"))
+        await writer.drain()
+    writer.close()
+
+#_run_service: Starts the server and runs it until it gets stopped.
+async def _run_service(service, host, port):
+    server = await asyncio.start_server(lambda reader, writer: _service_connection(service, reader, writer), host, port)
+    print("Solver service listening on", ", ".join(str(sock.getsockname()) for sock in server.sockets))
+    async with server:
+        await server.serve_forever()
+
+#serve: Runs the solver service (until you hit Ctrl-C). Every request is a JSON object on its own line, and can have an "id" that gets copied into the reply. Errors come back as {"error": ...}. The requests are:
+#   {"op": "libraries"} - the loaded dictionaries and their word lengths
+#   {"op": "new", "library": ..., "strategy": "max", "threshold": 2} - starts a game session with any of the computer modes (threshold is only for sacrifice), and gives back its "session" id
+#   {"op": "guess", "session": ...} - the session's next guess
+#   {"op": "feedback", "session": ..., "guess": ..., "feedback": [2, 0, 1, 1, 0] or "gbyyb"} - trims the session down after a guess ("guess" can be left out to mean the last suggested one), and gives back how many candidates are left and the first few of them
+#   {"op": "close", "session": ...} - ends a session
+#   {"op": "batch", "library": ..., "method": "max", "threshold": None, "keywords": [...], "seed": None} - plays a whole list of keywords and gives back the results, average and success %
+    #parameters: dictionaries - dict of library name to word list (each one can have its own word length). Defaults to the scrabble dictionary at word lengths 3-8; host; port; workers - number of worker processes; cache_size - size of each worker's decision cache; show - how many remaining words to send back after feedback
+    #returns: none
+def serve(dictionaries = "DEFAULT", host = "127.0.0.1", port = 8765, workers = None, cache_size = 4096, show = 20):
+    global _service_state
+    if dictionaries == "DEFAULT":
+        dictionaries = {"scrabble%d" % i: load_words("/home/skannan4/Downloads/WORD.LST", i, doprint = False) for i in range(3, 9)}
+    workers = workers or os.cpu_count() or 1
+    service = {"engines": {name: build_engine(words, len(words[0]), feedback = False, doprint = False, constraints = True) for name, words in dictionaries.items()}, "sessions": dict(), "count": 0, "workers": workers, "show": show}
+    cache = make_decision_cache(cache_size)
+    for engine in service["engines"].values(): #work out the opening guesses once here, so every worker starts out with them instead of each one working them out again
+        word_length = engine["word_length"]
+        guess_entropy(candidate_set(engine), word_length, candidate_set(engine)) #saves the minimax opener too
+        choose_guess(cache, guess_max, candidate_set(engine), word_length)
+        choose_guess(cache, guess_half, candidate_set(engine), word_length)
+        choose_guess(cache, guess_sacrifice, candidate_set(engine), word_length, list())
+    state = {"engines": service["engines"], "cache": cache}
+    if "fork" in multiprocessing.get_all_start_methods():
+        _service_state = state #forked workers inherit the engines as-is, no rebuilding or pickling needed
+        service["pool"] = ProcessPoolExecutor(workers, mp_context = multiprocessing.get_context("fork"))
+    else:
+        service["pool"] = ProcessPoolExecutor(workers, initializer = _init_service_worker, initargs = (state,))
+    try:
+        asyncio.run(_run_service(service, host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service["pool"].shutdown()
+        _service_state = None
+
+#ask_service: A bare-bones client for the solver service - sends some requests over one connection and waits for each reply.
+    #parameters: requests - list of request dicts; host; port
+    #returns: list of the replies
+def ask_service(requests, host = "127.0.0.1", port = 8765):
+    replies = list()
+    with socket.create_connection((host, port)) as connection:
+        f = connection.makefile("rw", encoding = "utf-8")
+        for request in requests:
+            f.write(json.dumps(request) + "\n")
+            f.flush()
+            replies.append(json.loads(f.readline()))
+    return replies